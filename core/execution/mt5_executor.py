@@ -248,7 +248,29 @@ class MT5Executor:
 
         # At this point we are in LIVE mode with enable_real_mt5_orders=True.
         return self._send_order_mt5(payload)
-    
+
+    def execute_orders_batch(self, orders: List[Dict[str, Any]]) -> List[ExecutionResult]:
+        """
+        Execute several orders in one call.
+
+        Orders are sent one after another through execute_order rather than
+        with order_send_async: the requote / invalid-stops retries and the
+        caller's failure counters and open-risk booking all need each
+        order's retcode and ticket before moving on.
+
+        Args:
+            orders: List of keyword-argument dicts accepted by execute_order
+
+        Returns:
+            ExecutionResults in the same order as the submitted orders
+        """
+        if not orders:
+            return []
+        if not self.enabled:
+            return [ExecutionResult(success=False, error_message="Executor disabled") for _ in orders]
+
+        return [self.execute_order(**order) for order in orders]
+
     def validate_broker_stops_before_order(
         self,
         symbol: str,
@@ -2,17 +2,18 @@
 Average True Range (ATR) indicator.
 """
 
+from collections import deque
 from decimal import Decimal
-from typing import List, Optional
+from typing import Deque, Optional, Sequence
 from ..models.ohlcv import Bar
 
 
-def compute_atr_simple(bars: List[Bar], period: int = 14) -> Optional[Decimal]:
+def compute_atr_simple(bars: Sequence[Bar], period: int = 14) -> Optional[Decimal]:
     """
     Compute ATR using simple method.
     
     Args:
-        bars: List of Bar objects (must be sorted by timestamp, ascending)
+        bars: Sequence of Bar objects, e.g. list or tuple (must be sorted by timestamp, ascending)
         period: ATR period (default 14)
     
     Returns:
@@ -21,9 +22,9 @@ def compute_atr_simple(bars: List[Bar], period: int = 14) -> Optional[Decimal]:
     if len(bars) < period + 1:
         return None
     
-    # Calculate true ranges
+    # Calculate true ranges (only the last 'period' are averaged, so skip older bars)
     true_ranges = []
-    for i in range(1, len(bars)):
+    for i in range(len(bars) - period, len(bars)):
         prev_close = bars[i - 1].close
         curr_high = bars[i].high
         curr_low = bars[i].low
@@ -43,3 +44,83 @@ def compute_atr_simple(bars: List[Bar], period: int = 14) -> Optional[Decimal]:
     atr = atr_sum / Decimal(period)
     
     return atr
+
+
+class IncrementalATR:
+    """
+    Rolling ATR that only processes bars it has not seen yet.
+    
+    Produces the same value as compute_atr_simple (simple average of the last
+    `period` true ranges) but keeps the true ranges and their Decimal running
+    sum between calls, so each new bar costs O(1) instead of a full pass over
+    the history. Decimal addition of price differences is exact, so the running
+    sum never drifts from a fresh sum.
+    
+    Smoothing stays the simple average rather than Wilder's recursive
+    (prev_atr * (period - 1) + tr) / period: SL/TP distances, clamps and the
+    volatility pause are all tuned against the simple ATR, and both forms are
+    O(1) per bar once incremental.
+    """
+    
+    def __init__(self, period: int = 14):
+        if period < 1:
+            raise ValueError("Period must be >= 1")
+        self.period = period
+        self._trs: Deque[Decimal] = deque(maxlen=period)
+        self._tr_sum = Decimal("0")
+        self._last_bar: Optional[Bar] = None
+    
+    def reset(self) -> None:
+        """Drop all accumulated state."""
+        self._trs.clear()
+        self._tr_sum = Decimal("0")
+        self._last_bar = None
+    
+    def _add(self, bar: Bar) -> None:
+        prev = self._last_bar
+        self._last_bar = bar
+        if prev is None:
+            return
+        
+        prev_close = prev.close
+        tr = max(bar.high - bar.low, abs(bar.high - prev_close), abs(bar.low - prev_close))
+        
+        if len(self._trs) == self.period:
+            self._tr_sum -= self._trs[0]
+        self._trs.append(tr)
+        self._tr_sum += tr
+    
+    def update(self, bars: Sequence[Bar]) -> Optional[Decimal]:
+        """
+        Sync with a bar window and return the ATR for its latest bar.
+        
+        Bars are matched on timestamp: a repeated window is a no-op, a window
+        that grew or rolled forward feeds only the unseen tail, and anything
+        else (gap, rewind, different series) reseeds from the window.
+        
+        Args:
+            bars: Bar window (must be sorted by timestamp, ascending)
+        
+        Returns:
+            ATR value or None if the window holds fewer than period + 1 bars
+        """
+        if not bars:
+            return None
+        
+        last_ts = self._last_bar.timestamp if self._last_bar is not None else None
+        if bars[-1].timestamp != last_ts:
+            i = len(bars) - 1
+            if last_ts is not None:
+                while i >= 0 and bars[i].timestamp > last_ts:
+                    i -= 1
+            if last_ts is not None and i >= 0 and bars[i].timestamp == last_ts:
+                new_bars = bars[i + 1:]
+            else:
+                self.reset()
+                new_bars = bars[-(self.period + 1):]
+            for bar in new_bars:
+                self._add(bar)
+        
+        if len(bars) < self.period + 1 or len(self._trs) < self.period:
+            return None
+        return self._tr_sum / Decimal(self.period)
@@ -2,10 +2,12 @@
 OHLCV data models for price bars and time series.
 """
 
+from array import array
+from collections import deque
 from decimal import Decimal
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
 
 @dataclass(frozen=True)
@@ -43,3 +45,123 @@ class OHLCV:
     def length(self) -> int:
         """Number of bars."""
         return len(self.bars)
+
+
+class BarColumns:
+    """Columnar (struct-of-arrays) float64 copy of a symbol's recent bars.
+
+    Keeps open/high/low/close and the true range (max of high - low and the
+    gaps to the previous close) in contiguous ``array('d')`` columns so
+    per-bar consumers can slice floats directly instead of walking Bar
+    objects. The true range is taken in Decimal before the float cast; the
+    first stored bar has no previous close, so its true range is its bar
+    range. Columns are appended as new bars arrive and trimmed back to
+    ``capacity``. When ``tr_window`` is set, a running sum of the last
+    ``tr_window`` true ranges is kept so their mean costs O(1) per bar.
+    """
+
+    FIELDS = ("open", "high", "low", "close", "tr")
+
+    def __init__(self, capacity: int = 500, tr_window: int = 0):
+        if capacity < 1:
+            raise ValueError("Capacity must be >= 1")
+        self.capacity = capacity
+        self.tr_window = max(0, tr_window)
+        self._cols: Dict[str, array] = {name: array("d") for name in self.FIELDS}
+        self._timestamps: List[datetime] = []
+        self._last_close: Optional[Decimal] = None
+        self._recent_trs: Deque[float] = deque()
+        self._tr_sum = 0.0
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        """Timestamp of the most recent stored bar."""
+        return self._timestamps[-1] if self._timestamps else None
+
+    def clear(self) -> None:
+        """Drop all stored bars."""
+        for col in self._cols.values():
+            del col[:]
+        del self._timestamps[:]
+        self._last_close = None
+        self._recent_trs.clear()
+        self._tr_sum = 0.0
+
+    def append(self, bar: Bar) -> None:
+        """Append a single bar to every column."""
+        cols = self._cols
+        cols["open"].append(float(bar.open))
+        cols["high"].append(float(bar.high))
+        cols["low"].append(float(bar.low))
+        cols["close"].append(float(bar.close))
+        high_low = bar.high - bar.low
+        prev_close = self._last_close
+        if prev_close is None:
+            tr = float(high_low)
+        else:
+            tr = float(max(high_low, abs(bar.high - prev_close), abs(bar.low - prev_close)))
+        self._last_close = bar.close
+        cols["tr"].append(tr)
+        self._timestamps.append(bar.timestamp)
+        if self.tr_window:
+            recent = self._recent_trs
+            if len(recent) == self.tr_window:
+                self._tr_sum -= recent.popleft()
+            recent.append(tr)
+            self._tr_sum += tr
+        # Trim in batches so the amortised cost per append stays O(1)
+        excess = len(self._timestamps) - self.capacity
+        if excess >= self.capacity:
+            for col in cols.values():
+                del col[:excess]
+            del self._timestamps[:excess]
+
+    def sync(self, bars: Sequence[Bar]) -> int:
+        """Bring the columns in line with a bar window, appending only new bars.
+
+        Bars are matched on timestamp: a repeated window is a no-op, a window
+        that grew or rolled forward appends the unseen tail, and anything else
+        (gap, rewind, different series) reseeds from the window.
+
+        Returns:
+            Number of bars appended
+        """
+        if not bars:
+            return 0
+        last_ts = self.last_timestamp
+        if last_ts is not None:
+            if bars[-1].timestamp == last_ts:
+                return 0
+            i = len(bars) - 1
+            while i >= 0 and bars[i].timestamp > last_ts:
+                i -= 1
+            if i >= 0 and bars[i].timestamp == last_ts:
+                new_bars = bars[i + 1:]
+            else:
+                self.clear()
+                new_bars = bars[-self.capacity:]
+        else:
+            new_bars = bars[-self.capacity:]
+        for bar in new_bars:
+            self.append(bar)
+        return len(new_bars)
+
+    def last_n(self, field: str, n: int) -> array:
+        """Return a float64 copy of the last ``n`` values of a column."""
+        if n <= 0:
+            return array("d")
+        col = self._cols[field]
+        return col[-n:]
+
+    def tr_mean(self, n: int) -> float:
+        """Mean true range over the last ``n`` bars (O(1) when ``n`` covers the running window)."""
+        if n <= 0:
+            return 0.0
+        # The running window holds the last min(len, tr_window) true ranges, so it
+        # also answers warm-up calls where fewer than tr_window bars exist
+        if n == len(self._recent_trs):
+            return self._tr_sum / n
+        return sum(self.last_n("tr", n)) / n
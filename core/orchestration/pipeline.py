@@ -1,26 +1,169 @@
 """Trading pipeline orchestration."""
 
+import importlib
 import logging
-import json
 import os
+import time
+from collections import deque
 from decimal import Decimal
-from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, Tuple
-
-from ..models.ohlcv import OHLCV
-from ..models.structure import Structure
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Deque, List, Optional, Dict, Any, Mapping, Tuple
+
+from ..models.ohlcv import OHLCV, BarColumns
+from ..models.structure import Structure, StructureType
 from ..models.decision import Decision, DecisionType, DecisionStatus
 from ..models.config import Config
 from ..structure.manager import StructureManager
 from ..execution.mt5_executor import MT5Executor, ExecutionMode
-from ..indicators.atr import compute_atr_simple
+from ..indicators.atr import IncrementalATR
 from .session_manager import SessionManager
 from .symbol_onboarding import SymbolOnboardingManager
 from .trade_journal import TradeJournal
 from .session_filter import SessionFilter
+from ..utils.json_cache import load_json_cached
 
 logger = logging.getLogger(__name__)
 
+try:  # MT5 is optional; the LIVE-only MT5 helpers return early when it is missing
+    import MetaTrader5 as _mt5  # type: ignore
+except ImportError:  # pragma: no cover - MT5 not installed in most test envs
+    _mt5 = None
+
+# HTF timeframe names -> MT5 timeframe constants (empty without MT5)
+_TF_MAP: Mapping[str, int] = MappingProxyType({
+    'M1': _mt5.TIMEFRAME_M1, 'M5': _mt5.TIMEFRAME_M5, 'M15': _mt5.TIMEFRAME_M15,
+    'M30': _mt5.TIMEFRAME_M30, 'H1': _mt5.TIMEFRAME_H1, 'H4': _mt5.TIMEFRAME_H4,
+    'D1': _mt5.TIMEFRAME_D1, 'W1': _mt5.TIMEFRAME_W1,
+} if _mt5 is not None else {})
+
+# HTF alignment result for bias/direction pairs outside the per-pipeline table
+_HTF_NEUTRAL: Tuple[str, float] = ('neutral', 0.0)
+
+# Structure types allowed an HTF elite override ("" = type unknown, also allowed)
+_ELITE_ELIGIBLE_STRUCTURES: frozenset = frozenset({'engulfing', 'order_block', 'break_of_structure', 'fair_value_gap'})
+
+# Shared read-only default for absent config sections (no throwaway {} per lookup)
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Repo configs directory and fixed config paths, resolved once at import
+_CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "configs"))
+_SESSIONS_PATH = os.path.join(_CONFIG_DIR, "sessions.json")
+_SYSTEM_PATH = os.path.join(_CONFIG_DIR, "system.json")
+
+
+def _load_json_config(name: str) -> Optional[Any]:
+    """
+    Load configs/<name>, or None if the file does not exist.
+    
+    Parsed results are shared between pipeline instances until the file's
+    mtime/size change, so callers must treat them as read-only.
+    """
+    try:
+        return load_json_cached(os.path.join(_CONFIG_DIR, name))
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _planner_cls() -> type:
+    """Structure exit planner class, imported once (the planner stays an optional dependency)."""
+    planner_mod = importlib.import_module("core.orchestration.structure_exit_planner")
+    return getattr(planner_mod, "StructureExitPlanner")
+
+# Order comments keyed by structure type value, built once instead of per order
+_ORDER_COMMENTS: Dict[str, str] = {st.value: f"DEVI_{st.value}" for st in StructureType}
+
+
+def _order_comment(structure_type: Optional[str]) -> str:
+    """Return the broker order comment for a structure type value."""
+    comment = _ORDER_COMMENTS.get(structure_type)
+    if comment is None:
+        comment = f"DEVI_{structure_type or 'UNKNOWN'}"
+    return comment
+
+
+# Decimal constants for legacy exits and the safety clamp (parsed once, not per structure)
+_LEGACY_SL_RANGE_FRAC = Decimal("0.1")
+_LEGACY_TP_RANGE_MULT = Decimal("2.0")
+_CLAMP_MIN_EPSILON = Decimal("0.00001")
+_CLAMP_RANGE_FRAC = Decimal("0.01")
+# Structure types the exit planner consumes (nearest of each per bar)
+_PLANNER_STRUCTURE_TYPES = frozenset(("order_block", "fair_value_gap", "rejection"))
+# Placeholder size on unsized decisions; the PR3 sizer replaces it
+_UNSIZED_POSITION_SIZE = Decimal("0.1")
+
+
+def _to_utc(ts: datetime) -> datetime:
+    """Treat naive timestamps as UTC; aware ones are returned unchanged."""
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def _as_decimal(value: Any) -> Decimal:
+    """Return value as Decimal, skipping the str round-trip when it already is one."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+@dataclass(frozen=True)
+class _SymbolMeta:
+    """Broker symbol fields used by the risk sizer, parsed once per symbol."""
+    point: float
+    contract_size: float
+    min_lot: float
+    max_lot: float
+    lot_step: float
+    sl_hard_floor_points: float
+    point_value_per_lot: float
+    # exact lot grid for position_size; floats above stay for risk math and logs
+    min_lot_dec: Decimal
+    max_lot_dec: Decimal
+    lot_step_dec: Decimal
+
+    @classmethod
+    def from_config(cls, symbol: str, meta: Dict[str, Any]) -> "_SymbolMeta":
+        point = float(meta.get("point", 0.0001))
+        # sane defaults: FX 100k, XAU 100
+        contract_size = float(meta.get("contract_size", 0.0)) or (100.0 if symbol.upper().startswith("XAU") else 100000.0)
+        min_lot = float(meta.get("volume_min", 0.01))
+        max_lot = float(meta.get("volume_max", 100.0))
+        lot_step = float(meta.get("volume_step", 0.01))
+        return cls(
+            point=point,
+            contract_size=contract_size,
+            min_lot=min_lot,
+            max_lot=max_lot,
+            lot_step=lot_step,
+            sl_hard_floor_points=float(meta.get("sl_hard_floor_points", 0)),
+            point_value_per_lot=contract_size * point,
+            min_lot_dec=Decimal(str(min_lot)),
+            max_lot_dec=Decimal(str(max_lot)),
+            lot_step_dec=Decimal(str(lot_step)),
+        )
+
+
+# Tolerance, in lot steps, when flooring a raw volume onto the lot grid
+_LOT_STEP_EPS = 1e-9
+
+
+def _size_volume(risk_budget: float, stop_distance_points: float, sym_meta: _SymbolMeta) -> Tuple[float, Optional[Decimal]]:
+    """
+    Size a position so that hitting the stop loses risk_budget.
+    
+    Returns:
+        (raw volume, exact Decimal volume floored to the lot step and capped at max lot),
+        with None as the second item when the floored volume is below min lot
+    """
+    volume_raw = risk_budget / max((stop_distance_points * sym_meta.point_value_per_lot), 1e-12)
+    # The epsilon absorbs float drift on exact step multiples (0.29 / 0.01 gives
+    # 28.999999999999996) without rounding genuinely short volumes up a step
+    steps = max(int(volume_raw / sym_meta.lot_step + _LOT_STEP_EPS), 0)
+    volume = sym_meta.lot_step_dec * steps
+    if volume < sym_meta.min_lot_dec:
+        return volume_raw, None
+    return volume_raw, min(volume, sym_meta.max_lot_dec)
+
 
 class TradingPipeline:
     """Main trading pipeline orchestrator."""
@@ -30,41 +173,93 @@ class TradingPipeline:
         self.structure_manager = StructureManager(config.structure_configs)
         self.executor = executor or MT5Executor(ExecutionMode.DRY_RUN)
 
+        # Optional executor hooks, resolved once (dry-run/test executors may lack them)
+        self._get_equity = getattr(self.executor, "get_equity", None)
+        self._get_open_risk = getattr(self.executor, "get_open_risk_by_symbol", None)
+        self._add_open_risk = getattr(self.executor, "add_open_risk", None)
+
         # Counters / accumulators
         self.processed_bars = 0
         self.decisions_generated = 0
         self.execution_results = []
-        self._all_decisions: List[Decision] = []
+
+        # Exit-method / RR-gate tallies for finalize_session, kept as running counts
+        # so long runs do not retain every generated Decision
+        self._exit_hist: Dict[str, int] = {"order_block": 0, "fair_value_gap": 0, "rejection": 0, "atr": 0, "legacy": 0}
+        self._rr_counts: Dict[str, List[int]] = {k: [0, 0] for k in list(self._exit_hist) + ["overall"]}
+        self._legacy_by_structure: Dict[str, Dict[str, int]] = {}
+
+        sys_cfg = self.config.system_configs or _EMPTY
+
+        # Minimum history before a bar is processed (synthetic/CSV runs warm up faster)
+        is_test_mode = sys_cfg.get("synthetic_mode", False) or \
+                       sys_cfg.get("data_source") in ["synthetic", "csv"]
+        self._min_bars = 5 if is_test_mode else 50
+
+        # Structure-stats runs: with the executor disabled, skip decision generation
+        # and keep only the session counters
+        self._skip_decisions_when_executor_disabled = bool(
+            sys_cfg.get("skip_decisions_when_executor_disabled", False)
+        )
 
         # ---- PR1: Sessions / guards ----
         try:
-            base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-            sessions_path = os.path.join(base_dir, "configs", "sessions.json")
-            system_path = os.path.join(base_dir, "configs", "system.json")
-            self.session_mgr = SessionManager(sessions_path, system_path)
+            self.session_mgr = SessionManager(_SESSIONS_PATH, _SYSTEM_PATH)
         except Exception as e:
             logger.warning("session_manager_init_failed", extra={"error": str(e)})
             self.session_mgr = None
 
+        # Volatility pause / autonomy / circuit breaker settings are fixed once
+        # SessionManager has loaded them, so parse them here instead of per bar
+        vp_cfg = (self.session_mgr.volatility_pause_cfg if self.session_mgr else None) or _EMPTY
+        self._vp_enabled = bool(vp_cfg.get("enable", False))
+        self._vp_spread_mult = float((vp_cfg.get("spread_multipliers") or _EMPTY).get("default", 1.8))
+        self._vp_lookback = int(vp_cfg.get("lookback_bars", 100))
+        self._vp_atr_mult = float(vp_cfg.get("atr_spike_multiplier", 2.0))
+        self._vp_pause_secs = int(vp_cfg.get("min_pause_seconds", 120))
+        self._vp_pause_delta = timedelta(seconds=self._vp_pause_secs)
+        autonomy = (self.session_mgr.autonomy if self.session_mgr else None) or _EMPTY
+        self._close_positions_on_session_end = bool(autonomy.get("close_positions_on_session_end", False))
+        self._max_full_sl_hits = self.session_mgr.get_max_full_sl_hits() if self.session_mgr else 2
+
+        # Per-symbol market-open/tradable result: symbol -> (expires_at monotonic, tradable).
+        # LIVE results expire after a short TTL; dry-run stubs are constant, so their
+        # entries only drop on session rotation
+        self._market_open_cache: Dict[str, Tuple[float, bool]] = {}
+        self._market_open_ttl = 5.0 if getattr(self.executor, "mode", None) == ExecutionMode.LIVE else float("inf")
+
+        # Per-symbol baseline spread: symbol -> (expires_at monotonic, spread). The
+        # baseline moves slowly, so LIVE reads are reused for a minute
+        self._baseline_spread_cache: Dict[str, Tuple[float, float]] = {}
+        self._baseline_spread_ttl = 60.0 if getattr(self.executor, "mode", None) == ExecutionMode.LIVE else float("inf")
+
+        # Per-symbol columnar float64 bar history, synced incrementally each bar
+        self._bar_capacity = max(500, self._vp_lookback)
+        self._bar_columns: Dict[str, BarColumns] = {}
+
+        # Per-symbol ATR(14) state, advanced only by bars not yet seen
+        self._atr_state: Dict[str, IncrementalATR] = {}
+
         # ---- PR3: Risk config + broker meta used by sizer ----
-        self.risk_cfg = dict((self.config.system_configs or {}).get("risk", {}) or {})
+        self.risk_cfg = dict(sys_cfg.get("risk") or _EMPTY)
         # sensible defaults so dry-run never crashes
         self.risk_cfg.setdefault("per_trade_pct", 0.25)                # % of equity
         self.risk_cfg.setdefault("per_symbol_open_risk_cap_pct", 0.75) # % of equity
-        self.default_equity = float((self.config.system_configs or {}).get("equity", 10000.0))
-        self.allow_meta_fallbacks = bool((self.config.system_configs or {}).get("allow_broker_meta_fallbacks", False))
+        self._per_trade_pct = float(self.risk_cfg["per_trade_pct"])
+        self._cap_pct = float(self.risk_cfg["per_symbol_open_risk_cap_pct"])
+        self.default_equity = float(sys_cfg.get("equity", 10000.0))
+        self.allow_meta_fallbacks = bool(sys_cfg.get("allow_broker_meta_fallbacks", False))
 
         if self.allow_meta_fallbacks:
             logger.warning("allowing_broker_meta_fallbacks")
 
-        self.broker_symbols = {}
+        # Read-only view: the parsed JSON is shared with other pipelines via the config cache
+        self.broker_symbols = MappingProxyType({})
         try:
-            broker_path = os.path.join(base_dir, "configs", "broker_symbols.json")
-            if os.path.exists(broker_path):
-                with open(broker_path, "r", encoding="utf-8") as f:
-                    broker_meta = json.load(f) or {}
+            broker_meta = _load_json_config("broker_symbols.json")
+            if broker_meta is not None:
                 # IMPORTANT: use inner "symbols" object
-                self.broker_symbols = broker_meta.get("symbols", {})
+                self.broker_symbols = MappingProxyType(broker_meta.get("symbols", {}))
             logger.info("broker_symbols_registered", extra={"registered": list(self.broker_symbols.keys())})
             
             # Wire broker symbol metadata into executor for per-symbol guards (e.g., sl_hard_floor_points)
@@ -72,29 +267,22 @@ class TradingPipeline:
                 self.executor._symbol_meta = self.broker_symbols
         except Exception as e:
             logger.exception("broker_meta_init_failed", extra={"error": str(e)})
-            self.broker_symbols = {}
+            self.broker_symbols = MappingProxyType({})
+        self._symbol_meta: Dict[str, _SymbolMeta] = {}
 
         # Load execution guards config first (needed by exit planner)
         try:
-            guards_path = os.path.join(base_dir, "configs", "execution_guards.json")
-            if os.path.exists(guards_path):
-                with open(guards_path, "r", encoding="utf-8") as f:
-                    self.guards_config = json.load(f) or {}
-            else:
-                self.guards_config = {}
+            self.guards_config = _load_json_config("execution_guards.json") or {}
         except Exception as e:
             logger.warning("execution_guards_config_load_failed", extra={"error": str(e)})
             self.guards_config = {}
         
         # Initialize exit planner (structure-first; optional via dynamic import)
         try:
-            import importlib
-            sltp_path = os.path.join(base_dir, "configs", "sltp.json")
-            with open(sltp_path, "r", encoding="utf-8") as f:
-                sltp_cfg = json.load(f)
-            planner_mod = importlib.import_module("core.orchestration.structure_exit_planner")
-            PlannerCls = getattr(planner_mod, "StructureExitPlanner")
-            self.exit_planner = PlannerCls(sltp_cfg, self.broker_symbols, self.guards_config)
+            sltp_cfg = _load_json_config("sltp.json")
+            if sltp_cfg is None:
+                raise FileNotFoundError(os.path.join(_CONFIG_DIR, "sltp.json"))
+            self.exit_planner = _planner_cls()(sltp_cfg, self.broker_symbols, self.guards_config)
         except Exception as e:
             logger.debug("exit_planner_init_failed", extra={"error": str(e)})
             self.exit_planner = None
@@ -106,7 +294,8 @@ class TradingPipeline:
             logger.warning("symbol_onboarding_init_failed", extra={"error": str(e)})
             self.onboarding_mgr = None
 
-        dd_cfg = dict((self.config.system_configs or {}).get("risk", {}) or {})
+        # Same "risk" block as risk_cfg; only keys the sizer defaults do not touch are read
+        dd_cfg = self.risk_cfg
         soft_pct = float(dd_cfg.get("daily_soft_stop_pct", -1.0))
         hard_pct = float(dd_cfg.get("daily_hard_stop_pct", -2.0))
         self._dd_soft_stop_frac = soft_pct / 100.0
@@ -116,12 +305,12 @@ class TradingPipeline:
         self._dd_soft_triggered = False
         self._dd_hard_triggered = False
         self._consecutive_send_failures = 0
-        self._last_failure_time: Optional[datetime] = None  # Track last failure for cooldown
+        self._last_failure_time: Optional[float] = None  # time.monotonic() of last failure, for cooldown
         self._failure_cooldown_seconds = int(dd_cfg.get("failure_cooldown_seconds", 1800))  # 30 min default
         self._last_reset_date = None  # Track last daily reset for soft stop
 
         # FTMO limits (shadow safety layer)
-        ftmo_cfg = dict((self.config.system_configs or {}).get("ftmo_limits", {}) or {})
+        ftmo_cfg = sys_cfg.get("ftmo_limits") or _EMPTY
         self._ftmo_max_daily_loss_pct = float(ftmo_cfg.get("max_daily_loss_pct", -5.0))
         self._ftmo_max_total_loss_pct = float(ftmo_cfg.get("max_total_loss_pct", -10.0))
         self._ftmo_profit_target_pct = float(ftmo_cfg.get("profit_target_pct", 10.0))
@@ -136,22 +325,27 @@ class TradingPipeline:
         self._ftmo_total_stop_triggered = False
 
         # Environment tracking
-        env_cfg = dict((self.config.system_configs or {}).get("env", {}) or {})
+        env_cfg = sys_cfg.get("env") or _EMPTY
         self._env_mode = env_cfg.get("mode", "paper")
         self._env_account_size = float(env_cfg.get("account_size", 10000))
         
         # Margin guard configuration (guards_config already loaded above)
-        margin_guard = self.guards_config.get('margin_guard', {})
+        margin_guard = self.guards_config.get('margin_guard', _EMPTY)
         self.enable_margin_guard = margin_guard.get('enabled', True)
         self.min_margin_level_pct = float(margin_guard.get('min_margin_level_pct', 200.0))
         self.max_free_margin_usage_pct = float(margin_guard.get('max_free_margin_usage_pct', 30.0))
         self.max_total_open_risk_pct = float(margin_guard.get('max_total_open_risk_pct', 4.5))
         
         # Position tracking for close logging
+        position_tracking = self.guards_config.get('position_tracking', _EMPTY)
+        self._position_tracking_enabled = position_tracking.get('enabled', True)
         self.last_position_check_time = datetime.now(timezone.utc)
+        # Deal history is polled at most once per interval (monotonic deadline), not every bar
+        self._position_check_interval = float(position_tracking.get('check_interval_seconds', 10))
+        self._next_position_check = 0.0
         
         # Trade journal for outcome tracking
-        journal_cfg = self.guards_config.get('trade_journal', {})
+        journal_cfg = self.guards_config.get('trade_journal', _EMPTY)
         journal_enabled = journal_cfg.get('enabled', True)
         journal_dir = journal_cfg.get('journal_dir', None)
         try:
@@ -168,25 +362,30 @@ class TradingPipeline:
             self.session_filter = None
 
         # Position limit configuration (prevents stacking)
-        pos_limit_cfg = self.guards_config.get('position_limit', {})
+        pos_limit_cfg = self.guards_config.get('position_limit', _EMPTY)
         self._enable_position_limit = pos_limit_cfg.get('enabled', True)
         self._max_positions_per_symbol = int(pos_limit_cfg.get('max_positions_per_symbol', 2))
         self._max_positions_per_direction = int(pos_limit_cfg.get('max_positions_per_direction_per_symbol', 2))
         self._log_position_limit_blocks = pos_limit_cfg.get('log_blocked_trades', True)
 
         # Conflict resolver configuration (raises threshold when BUY+SELL conflict)
-        conflict_cfg = self.guards_config.get('conflict_resolver', {})
+        conflict_cfg = self.guards_config.get('conflict_resolver', _EMPTY)
         self._enable_conflict_resolver = conflict_cfg.get('enabled', True)
         self._conflict_lookback_bars = int(conflict_cfg.get('lookback_bars', 4))
         self._conflict_threshold_bump = float(conflict_cfg.get('threshold_bump_on_conflict', 0.15))
         self._conflict_require_confluence = conflict_cfg.get('require_confluence_on_conflict', False)
         self._log_conflicts = conflict_cfg.get('log_conflicts', True)
+        # Per-session base thresholds the conflict bump is added to
+        scoring_scales = ((self.config.structure_configs or _EMPTY).get("scoring") or _EMPTY).get("scales") or _EMPTY
+        self._conflict_session_scales = (scoring_scales.get("M15") or _EMPTY).get("fx") or _EMPTY
         
-        # Signal history for conflict detection: {symbol: [(timestamp, direction, bar_index), ...]}
-        self._signal_history: Dict[str, List[Tuple[datetime, str, int]]] = {}
+        # Signal history for conflict detection: {symbol: deque[(direction, bar_index)]},
+        # oldest first, with per-direction counts of the entries still in the window
+        self._signal_history: Dict[str, Deque[Tuple[str, int]]] = {}
+        self._signal_counts: Dict[str, Dict[str, int]] = {}
 
         # HTF Bias configuration (Option A+ - soft scoring)
-        htf_cfg = self.guards_config.get('htf_bias', {})
+        htf_cfg = self.guards_config.get('htf_bias', _EMPTY)
         self._enable_htf_bias = htf_cfg.get('enabled', False)
         self._htf_timeframe = htf_cfg.get('timeframe', 'H1')
         self._htf_ema_period = int(htf_cfg.get('ema_period', 50))
@@ -194,6 +393,13 @@ class TradingPipeline:
         self._htf_neutral_zone_mult = float(htf_cfg.get('neutral_zone_atr_mult', 0.5))
         self._htf_bias_bonus = float(htf_cfg.get('bias_bonus', 0.05))
         self._htf_bias_penalty = float(htf_cfg.get('bias_penalty', 0.10))
+        # (bias, direction) -> (alignment, score modifier); anything else is neutral
+        self._htf_alignment: Dict[Tuple[str, str], Tuple[str, float]] = {
+            ('bullish', 'BUY'): ('aligned', self._htf_bias_bonus),
+            ('bearish', 'SELL'): ('aligned', self._htf_bias_bonus),
+            ('bullish', 'SELL'): ('counter', -self._htf_bias_penalty),
+            ('bearish', 'BUY'): ('counter', -self._htf_bias_penalty),
+        }
         self._htf_override_score = float(htf_cfg.get('countertrend_override_score', 0.82))
         self._htf_hard_block = htf_cfg.get('hard_block', False)  # Can be True, False, or 'conditional'
         self._htf_hard_block_clear_mult = float(htf_cfg.get('hard_block_clear_trend_mult', 1.5))
@@ -201,10 +407,25 @@ class TradingPipeline:
         self._htf_log_checks = htf_cfg.get('log_bias_checks', True)
         
         # Structure-specific thresholds (e.g., BoS requires higher confidence)
-        self._structure_thresholds = self.guards_config.get('structure_thresholds', {})
+        self._structure_thresholds = self.guards_config.get('structure_thresholds', _EMPTY)
+        # (structure_type, direction) -> threshold. A direction-specific key
+        # (e.g. rejection_buy) overrides the general one for that side only
+        self._structure_threshold_by_side: Dict[Tuple[str, str], float] = {}
+        numeric_thresholds = {
+            k: float(v) for k, v in self._structure_thresholds.items()
+            if isinstance(v, (int, float)) and not isinstance(v, bool)
+        }
+        for key, value in numeric_thresholds.items():
+            for side in ('BUY', 'SELL'):
+                self._structure_threshold_by_side.setdefault((key, side), value)
+        for key, value in numeric_thresholds.items():
+            for side in ('BUY', 'SELL'):
+                suffix = '_' + side.lower()
+                if key.endswith(suffix):
+                    self._structure_threshold_by_side[(key[:-len(suffix)], side)] = value
         
-        # Cache for HTF data: {symbol: {'ema': float, 'atr': float, 'close': float, 'bias': str, 'last_update': datetime}}
-        self._htf_cache: Dict[str, Dict[str, Any]] = {}
+        # Cache for HTF data: symbol -> (expires_at monotonic, bias, score_modifier, details)
+        self._htf_cache: Dict[str, Tuple[float, str, float, Dict[str, Any]]] = {}
         self._htf_cache_ttl_seconds = 300  # Refresh HTF data every 5 minutes (reduced from 15 to prevent stale trend data)
 
     def check_margin_and_risk_before_trade(
@@ -223,9 +444,7 @@ class TradingPipeline:
             return True, None
         
         # Only check in LIVE mode with MT5 available
-        try:
-            import MetaTrader5 as mt5
-        except ImportError:
+        if _mt5 is None:
             return True, None
         
         if self.executor.mode != ExecutionMode.LIVE:
@@ -233,7 +452,7 @@ class TradingPipeline:
         
         try:
             # Get account state
-            account = mt5.account_info()
+            account = _mt5.account_info()
             if account is None:
                 logger.error("margin_check_failed", extra={"reason": "account_info_unavailable"})
                 return True, None  # Allow trade if we can't check
@@ -243,24 +462,32 @@ class TradingPipeline:
             margin_level = account.margin_level if account.margin_level else 0
             
             # Get all open positions
-            positions = mt5.positions_get()
+            positions = _mt5.positions_get()
             open_positions = list(positions) if positions else []
             open_count = len(open_positions)
             
+            # symbol_info is an IPC round-trip; fetch each symbol at most once per check
+            symbol_info = _mt5.symbol_info(symbol)
+            infos = {symbol: symbol_info}
+            
             # Calculate total open risk using actual contract sizes
             total_open_risk = 0.0
             for pos in open_positions:
-                if pos.sl > 0:  # Has stop loss
-                    sl_distance = abs(pos.price_open - pos.sl)
+                pos_sl = pos.sl
+                if pos_sl > 0:  # Has stop loss
+                    sl_distance = abs(pos.price_open - pos_sl)
                     # Get contract size for this position's symbol
-                    pos_symbol_info = mt5.symbol_info(pos.symbol)
+                    pos_symbol = pos.symbol
+                    if pos_symbol in infos:
+                        pos_symbol_info = infos[pos_symbol]
+                    else:
+                        pos_symbol_info = infos[pos_symbol] = _mt5.symbol_info(pos_symbol)
                     if pos_symbol_info:
                         contract_size = pos_symbol_info.trade_contract_size
                         pos_risk = pos.volume * sl_distance * contract_size
                         total_open_risk += pos_risk
             
             # Calculate new trade risk using actual contract size
-            symbol_info = mt5.symbol_info(symbol)
             if symbol_info is None:
                 return True, None  # Allow if we can't get symbol info
             
@@ -276,54 +503,58 @@ class TradingPipeline:
             
             # GUARD 1: Margin level too low
             if margin_level > 0 and margin_level < self.min_margin_level_pct:
-                logger.warning("margin_guard_blocked", extra={
-                    "symbol": symbol,
-                    "reason": "margin_level_too_low",
-                    "margin_level": margin_level,
-                    "min_required": self.min_margin_level_pct,
-                    "margin_free": margin_free,
-                    "open_positions": open_count
-                })
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning("margin_guard_blocked", extra={
+                        "symbol": symbol,
+                        "reason": "margin_level_too_low",
+                        "margin_level": margin_level,
+                        "min_required": self.min_margin_level_pct,
+                        "margin_free": margin_free,
+                        "open_positions": open_count
+                    })
                 return False, f"Margin level {margin_level:.0f}% < {self.min_margin_level_pct:.0f}%"
             
             # GUARD 2: Insufficient free margin
             if margin_free > 0:
                 margin_usage_pct = (estimated_margin_needed / margin_free) * 100
                 if margin_usage_pct > self.max_free_margin_usage_pct:
-                    logger.warning("margin_guard_blocked", extra={
-                        "symbol": symbol,
-                        "reason": "insufficient_free_margin",
-                        "estimated_margin_needed": estimated_margin_needed,
-                        "margin_free": margin_free,
-                        "usage_pct": margin_usage_pct,
-                        "max_allowed_pct": self.max_free_margin_usage_pct,
-                        "open_positions": open_count
-                    })
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning("margin_guard_blocked", extra={
+                            "symbol": symbol,
+                            "reason": "insufficient_free_margin",
+                            "estimated_margin_needed": estimated_margin_needed,
+                            "margin_free": margin_free,
+                            "usage_pct": margin_usage_pct,
+                            "max_allowed_pct": self.max_free_margin_usage_pct,
+                            "open_positions": open_count
+                        })
                     return False, f"Trade needs {margin_usage_pct:.1f}% of free margin (max {self.max_free_margin_usage_pct:.0f}%)"
             
             # GUARD 3: Total open risk exceeds cap
             if total_risk_pct > self.max_total_open_risk_pct:
-                logger.warning("margin_guard_blocked", extra={
-                    "symbol": symbol,
-                    "reason": "open_risk_cap_exceeded",
-                    "total_risk_after": total_risk_after,
-                    "total_risk_pct": total_risk_pct,
-                    "max_open_risk_pct": self.max_total_open_risk_pct,
-                    "open_positions": open_count,
-                    "new_trade_risk": new_trade_risk
-                })
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning("margin_guard_blocked", extra={
+                        "symbol": symbol,
+                        "reason": "open_risk_cap_exceeded",
+                        "total_risk_after": total_risk_after,
+                        "total_risk_pct": total_risk_pct,
+                        "max_open_risk_pct": self.max_total_open_risk_pct,
+                        "open_positions": open_count,
+                        "new_trade_risk": new_trade_risk
+                    })
                 return False, f"Total risk {total_risk_pct:.2f}% > {self.max_total_open_risk_pct:.1f}%"
             
             # All checks passed
-            logger.info("margin_check_passed", extra={
-                "symbol": symbol,
-                "margin_free": margin_free,
-                "margin_level": margin_level,
-                "open_positions": open_count,
-                "total_open_risk": total_open_risk,
-                "new_trade_risk": new_trade_risk,
-                "total_risk_pct": total_risk_pct
-            })
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("margin_check_passed", extra={
+                    "symbol": symbol,
+                    "margin_free": margin_free,
+                    "margin_level": margin_level,
+                    "open_positions": open_count,
+                    "total_open_risk": total_open_risk,
+                    "new_trade_risk": new_trade_risk,
+                    "total_risk_pct": total_risk_pct
+                })
             
             return True, None
             
@@ -349,9 +580,7 @@ class TradingPipeline:
             return True, None
         
         # Only check in LIVE mode with MT5 available
-        try:
-            import MetaTrader5 as mt5
-        except ImportError:
+        if _mt5 is None:
             return True, None
         
         if self.executor.mode != ExecutionMode.LIVE:
@@ -359,20 +588,22 @@ class TradingPipeline:
         
         try:
             # Get all open positions for this symbol
-            positions = mt5.positions_get(symbol=symbol)
+            positions = _mt5.positions_get(symbol=symbol)
             if positions is None:
                 positions = []
             
             total_positions = len(positions)
-            same_direction_positions = sum(
-                1 for p in positions 
-                if (p.type == mt5.ORDER_TYPE_BUY and direction == 'BUY') or
-                   (p.type == mt5.ORDER_TYPE_SELL and direction == 'SELL')
-            )
+            if direction == 'BUY':
+                target_type = _mt5.ORDER_TYPE_BUY
+            elif direction == 'SELL':
+                target_type = _mt5.ORDER_TYPE_SELL
+            else:
+                target_type = None
+            same_direction_positions = sum(1 for p in positions if p.type == target_type)
             
             # Check total positions per symbol
             if total_positions >= self._max_positions_per_symbol:
-                if self._log_position_limit_blocks:
+                if self._log_position_limit_blocks and logger.isEnabledFor(logging.INFO):
                     logger.info("position_limit_blocked", extra={
                         "symbol": symbol,
                         "direction": direction,
@@ -384,7 +615,7 @@ class TradingPipeline:
             
             # Check positions per direction
             if same_direction_positions >= self._max_positions_per_direction:
-                if self._log_position_limit_blocks:
+                if self._log_position_limit_blocks and logger.isEnabledFor(logging.INFO):
                     logger.info("position_limit_blocked", extra={
                         "symbol": symbol,
                         "direction": direction,
@@ -415,6 +646,9 @@ class TradingPipeline:
         Check for conflicting signals (BUY and SELL within lookback window).
         If conflict detected, raises the required threshold.
         
+        History is trimmed from the left and counted incrementally, so each
+        call costs amortised O(1) regardless of window length.
+        
         Args:
             symbol: Trading symbol
             direction: 'BUY' or 'SELL'
@@ -428,23 +662,26 @@ class TradingPipeline:
             return True, 0.0, None
         
         # Initialize signal history for symbol if needed
-        if symbol not in self._signal_history:
-            self._signal_history[symbol] = []
+        history = self._signal_history.get(symbol)
+        if history is None:
+            history = self._signal_history[symbol] = deque()
+            counts = self._signal_counts[symbol] = {'BUY': 0, 'SELL': 0}
+        else:
+            counts = self._signal_counts[symbol]
         
-        # Clean old signals outside lookback window
+        # Expire old signals outside lookback window; bar indices only grow,
+        # so expired entries are always at the left
         min_bar_index = current_bar_index - self._conflict_lookback_bars
-        self._signal_history[symbol] = [
-            (ts, d, idx) for ts, d, idx in self._signal_history[symbol]
-            if idx >= min_bar_index
-        ]
+        while history and history[0][1] < min_bar_index:
+            counts[history.popleft()[0]] -= 1
         
         # Check for opposing signals in recent history
-        recent_signals = self._signal_history[symbol]
-        buy_count = sum(1 for _, d, _ in recent_signals if d == 'BUY')
-        sell_count = sum(1 for _, d, _ in recent_signals if d == 'SELL')
+        buy_count = counts['BUY']
+        sell_count = counts['SELL']
         
         # Add current signal to history
-        self._signal_history[symbol].append((datetime.now(timezone.utc), direction, current_bar_index))
+        history.append((direction, current_bar_index))
+        counts[direction] = counts.get(direction, 0) + 1
         
         # Detect conflict: both BUY and SELL signals in lookback window
         has_conflict = (
@@ -456,7 +693,7 @@ class TradingPipeline:
             adjusted_threshold = self._conflict_threshold_bump
             conflict_info = f"Conflict detected: {buy_count} BUY, {sell_count} SELL in last {self._conflict_lookback_bars} bars"
             
-            if self._log_conflicts:
+            if self._log_conflicts and logger.isEnabledFor(logging.INFO):
                 logger.info("signal_conflict_detected", extra={
                     "symbol": symbol,
                     "direction": direction,
@@ -487,41 +724,32 @@ class TradingPipeline:
         if not self._enable_htf_bias:
             return 'neutral', 0.0, {'enabled': False}
         
-        try:
-            import MetaTrader5 as mt5
-        except ImportError:
+        if _mt5 is None:
             return 'neutral', 0.0, {'error': 'mt5_unavailable'}
         
         if self.executor.mode != ExecutionMode.LIVE:
             return 'neutral', 0.0, {'error': 'not_live_mode'}
         
-        now = datetime.now(timezone.utc)
+        now = time.monotonic()
         
         # Check cache first
-        if symbol in self._htf_cache:
-            cached = self._htf_cache[symbol]
-            age_seconds = (now - cached.get('last_update', now)).total_seconds()
-            if age_seconds < self._htf_cache_ttl_seconds:
-                return cached['bias'], cached['score_modifier'], cached['details']
+        cached = self._htf_cache.get(symbol)
+        if cached is not None and cached[0] > now:
+            return cached[1], cached[2], cached[3]
         
         try:
-            # Map timeframe string to MT5 constant
-            tf_map = {
-                'M1': mt5.TIMEFRAME_M1, 'M5': mt5.TIMEFRAME_M5, 'M15': mt5.TIMEFRAME_M15,
-                'M30': mt5.TIMEFRAME_M30, 'H1': mt5.TIMEFRAME_H1, 'H4': mt5.TIMEFRAME_H4,
-                'D1': mt5.TIMEFRAME_D1, 'W1': mt5.TIMEFRAME_W1
-            }
-            htf = tf_map.get(self._htf_timeframe, mt5.TIMEFRAME_H1)
+            htf = _TF_MAP.get(self._htf_timeframe, _mt5.TIMEFRAME_H1)
             
             # Fetch HTF bars
-            rates = mt5.copy_rates_from_pos(symbol, htf, 0, self._htf_lookback_bars)
+            rates = _mt5.copy_rates_from_pos(symbol, htf, 0, self._htf_lookback_bars)
             if rates is None or len(rates) < max(self._htf_ema_period, self._htf_atr_period) + 1:
                 return 'neutral', 0.0, {'error': 'insufficient_htf_data', 'bars': len(rates) if rates is not None else 0}
             
-            # Extract close prices and calculate EMA
-            closes = [float(r['close']) for r in rates]
-            highs = [float(r['high']) for r in rates]
-            lows = [float(r['low']) for r in rates]
+            # copy_rates_from_pos returns a structured ndarray; column tolist()
+            # converts each field to Python floats in one C-level pass
+            closes = rates['close'].tolist()
+            highs = rates['high'].tolist()
+            lows = rates['low'].tolist()
             
             # Calculate EMA
             ema = self._calculate_ema(closes, self._htf_ema_period)
@@ -559,12 +787,7 @@ class TradingPipeline:
             }
             
             # Cache the result
-            self._htf_cache[symbol] = {
-                'bias': bias,
-                'score_modifier': score_modifier,
-                'details': details,
-                'last_update': now
-            }
+            self._htf_cache[symbol] = (now + self._htf_cache_ttl_seconds, bias, score_modifier, details)
             
             return bias, score_modifier, details
             
@@ -602,64 +825,51 @@ class TradingPipeline:
         
         bias, _, htf_details = self.get_htf_bias(symbol)
         
-        # Determine alignment
-        is_aligned = (
-            (bias == 'bullish' and direction == 'BUY') or
-            (bias == 'bearish' and direction == 'SELL')
-        )
-        is_counter = (
-            (bias == 'bullish' and direction == 'SELL') or
-            (bias == 'bearish' and direction == 'BUY')
-        )
-        is_neutral = (bias == 'neutral')
-        
-        # Calculate score adjustment
-        if is_aligned:
-            score_modifier = self._htf_bias_bonus
-            alignment = 'aligned'
-        elif is_counter:
-            score_modifier = -self._htf_bias_penalty
-            alignment = 'counter'
-        else:
-            score_modifier = 0.0
-            alignment = 'neutral'
+        # Determine alignment and score adjustment
+        alignment, score_modifier = self._htf_alignment.get((bias, direction), _HTF_NEUTRAL)
+        is_counter = alignment == 'counter'
         
         adjusted_score = original_score + score_modifier
         
-        # Determine if we're in a clear trend FIRST (before elite override check)
-        # This must be calculated regardless of elite override status
+        # Aligned and neutral trades can neither be blocked nor need an override,
+        # so the clear-trend / elite / hard-block checks only run for counter-trend
         is_clear_trend = False
-        if is_counter and self._htf_hard_block == 'conditional':
-            ema = htf_details.get('ema', 0)
-            current_close = htf_details.get('current_close', 0)
-            neutral_zone = htf_details.get('neutral_zone', 0)
-            
-            if ema and current_close and neutral_zone:
-                distance_from_ema = abs(current_close - ema)
-                clear_threshold = neutral_zone * self._htf_hard_block_clear_mult
-                is_clear_trend = distance_from_ema > clear_threshold
-        
-        # Check for elite override (counter-trend but high confidence)
-        # CRITICAL FIX: Elite override is NOT allowed when is_clear_trend is true
-        # This prevents high-confidence counter-trend trades in obvious trends
-        # ADDITIONAL FIX: Rejection signals are NOT eligible for elite override
-        # because big rejection candles often occur as counter-trend bounces in strong trends
-        elite_eligible_structures = {'engulfing', 'order_block', 'break_of_structure', 'fair_value_gap'}
-        is_elite_eligible = structure_type in elite_eligible_structures or structure_type == ""
-        elite_override = is_counter and original_score >= self._htf_override_score and not is_clear_trend and is_elite_eligible
-        
-        # Determine if we should hard block
-        # Supports: True (always block counter), False (never block), 'conditional' (block only clear trends)
+        elite_override = False
         should_block = False
         
-        if is_counter and not elite_override:
-            if self._htf_hard_block == True:
-                # Always hard block counter-trend (unless elite)
-                should_block = True
-            elif self._htf_hard_block == 'conditional':
-                # Block when price is clearly outside neutral zone
-                # is_clear_trend already calculated above
-                should_block = is_clear_trend
+        if is_counter:
+            hard_block = self._htf_hard_block
+            
+            # Determine if we're in a clear trend FIRST (before elite override check)
+            # This must be calculated regardless of elite override status
+            if hard_block == 'conditional':
+                ema = htf_details.get('ema', 0)
+                current_close = htf_details.get('current_close', 0)
+                neutral_zone = htf_details.get('neutral_zone', 0)
+                
+                if ema and current_close and neutral_zone:
+                    distance_from_ema = abs(current_close - ema)
+                    clear_threshold = neutral_zone * self._htf_hard_block_clear_mult
+                    is_clear_trend = distance_from_ema > clear_threshold
+            
+            # Check for elite override (counter-trend but high confidence)
+            # CRITICAL FIX: Elite override is NOT allowed when is_clear_trend is true
+            # This prevents high-confidence counter-trend trades in obvious trends
+            # ADDITIONAL FIX: Rejection signals are NOT eligible for elite override
+            # because big rejection candles often occur as counter-trend bounces in strong trends
+            is_elite_eligible = structure_type in _ELITE_ELIGIBLE_STRUCTURES or structure_type == ""
+            elite_override = original_score >= self._htf_override_score and not is_clear_trend and is_elite_eligible
+            
+            # Determine if we should hard block
+            # Supports: True (always block counter), False (never block), 'conditional' (block only clear trends)
+            if not elite_override:
+                if hard_block == True:
+                    # Always hard block counter-trend (unless elite)
+                    should_block = True
+                elif hard_block == 'conditional':
+                    # Block when price is clearly outside neutral zone
+                    # is_clear_trend already calculated above
+                    should_block = is_clear_trend
         
         details = {
             'htf_bias': bias,
@@ -708,59 +918,65 @@ class TradingPipeline:
         if len(highs) < period + 1:
             return None
         
-        true_ranges = []
-        for i in range(1, len(highs)):
+        # Simple average of last 'period' true ranges; earlier bars never
+        # contribute, so only those are computed
+        total = 0.0
+        for i in range(len(highs) - period, len(highs)):
             high = highs[i]
             low = lows[i]
             prev_close = closes[i - 1]
             
-            tr = max(
+            total += max(
                 high - low,
                 abs(high - prev_close),
                 abs(low - prev_close)
             )
-            true_ranges.append(tr)
         
-        if len(true_ranges) < period:
-            return None
-        
-        # Simple average of last 'period' true ranges
-        return sum(true_ranges[-period:]) / period
+        return total / period
 
     def track_position_closes(self):
         """Check for closed positions since last check and log them."""
-        position_tracking = self.guards_config.get('position_tracking', {})
-        if not position_tracking.get('enabled', True):
-            return
-        
         # Only track in LIVE mode with MT5 available
-        try:
-            import MetaTrader5 as mt5
-        except ImportError:
+        if not self._position_tracking_enabled or _mt5 is None or self.executor.mode != ExecutionMode.LIVE:
             return
         
-        if self.executor.mode != ExecutionMode.LIVE:
+        # Throttle to check_interval_seconds; deals are fetched since the last check,
+        # so a skipped call only delays logging, it never drops a close
+        now = time.monotonic()
+        if now < self._next_position_check:
             return
+        self._next_position_check = now + self._position_check_interval
         
         try:
             # Get deals since last check
             from_date = self.last_position_check_time
             to_date = datetime.now(timezone.utc)
             
-            deals = mt5.history_deals_get(from_date, to_date)
+            deals = _mt5.history_deals_get(from_date, to_date)
             if deals is None or len(deals) == 0:
                 self.last_position_check_time = to_date
                 return
             
+            # Original orders per position and symbol_info per symbol, fetched once per
+            # batch (partial closes share a position, closes often share a symbol).
+            # Orders stay per-position: the opening order usually predates from_date,
+            # so a from/to order query would miss it.
+            original_orders: Dict[int, Any] = {}
+            infos: Dict[str, Any] = {}
+            
             # Filter for position closes (DEAL_ENTRY_OUT)
             for deal in deals:
-                if deal.entry == mt5.DEAL_ENTRY_OUT:  # Position close
+                if deal.entry == _mt5.DEAL_ENTRY_OUT:  # Position close
                     # Get original position details
                     position_ticket = deal.position_id
                     
                     # Try to get original order details
-                    orders = mt5.history_orders_get(position=position_ticket)
-                    original_order = orders[0] if orders and len(orders) > 0 else None
+                    if position_ticket in original_orders:
+                        original_order = original_orders[position_ticket]
+                    else:
+                        orders = _mt5.history_orders_get(position=position_ticket)
+                        original_order = orders[0] if orders and len(orders) > 0 else None
+                        original_orders[position_ticket] = original_order
                     
                     # Determine close reason
                     close_reason = "unknown"
@@ -800,7 +1016,10 @@ class TradingPipeline:
                     if self.trade_journal is not None:
                         try:
                             # Get point for pip calculation
-                            symbol_info = mt5.symbol_info(deal.symbol)
+                            if deal.symbol in infos:
+                                symbol_info = infos[deal.symbol]
+                            else:
+                                symbol_info = infos[deal.symbol] = _mt5.symbol_info(deal.symbol)
                             point = symbol_info.point if symbol_info else None
                             
                             self.trade_journal.record_outcome(
@@ -831,28 +1050,43 @@ class TradingPipeline:
         """Process a single bar through the pipeline."""
         decisions: List[Decision] = []
 
+        # Warm-up gate: nothing downstream can act on a short history, so skip
+        # session/executor calls entirely until enough bars are buffered
+        n_bars = len(data.bars)
+        if n_bars < self._min_bars:
+            return decisions
+
+        ts_utc = _to_utc(timestamp)
+        ts_iso = timestamp.isoformat()
+        sm = self.session_mgr
+        ex = self.executor
+
+        # Set by the session/market stage below; recomputed in the decision stage if
+        # that stage raised before reaching it
+        atr_val: Optional[Decimal] = None
+        # Likewise bound up front for the decision stage; rebound after rotation.
+        # session_mgr is None when SessionManager failed to initialise
+        session = sm.current_session if sm is not None else None
+        counters = sm.session_counters if sm is not None else None
+
         try:
-            # NEW: Track position closes at start of each bar
-            self.track_position_closes()
-            
             # Session rotation + optional close-out (PR1)
-            prev_sess, new_sess = self.session_mgr.update_and_rotate(timestamp)
+            prev_sess, new_sess = sm.update_and_rotate(timestamp)
+            # current_session and session_counters only change on rotation, so bind them once here
+            session = sm.current_session
+            counters = sm.session_counters
             if new_sess is not None:
-                logger.info("session_rotated", extra={"from": prev_sess, "to": self.session_mgr.current_session})
-                if prev_sess and self.session_mgr.autonomy.get("close_positions_on_session_end", False):
-                    self.executor.close_positions(self.session_mgr.tracked_symbols)
+                logger.info("session_rotated", extra={"from": prev_sess, "to": session})
+                self._market_open_cache.clear()
+                self._baseline_spread_cache.clear()
+                if prev_sess and self._close_positions_on_session_end:
+                    ex.close_positions(sm.tracked_symbols)
 
             # Daily reset for soft stop and baseline equity (00:00 UTC)
             current_date = timestamp.date()
             if self._last_reset_date is None or current_date > self._last_reset_date:
                 # Get current equity for new baseline
-                if hasattr(self.executor, "get_equity"):
-                    try:
-                        current_equity = float(self.executor.get_equity())
-                    except Exception:
-                        current_equity = self.default_equity
-                else:
-                    current_equity = self.default_equity
+                current_equity = self._current_equity()
                 
                 if self._dd_soft_triggered or self._dd_baseline_equity is not None:
                     logger.info("daily_reset_soft_stop", extra={
@@ -873,65 +1107,83 @@ class TradingPipeline:
                 self._ftmo_daily_stop_triggered = False
 
             # Market guards (PR1)
-            if not self.executor.is_market_open() or not self.executor.is_symbol_tradable(data.symbol):
-                logger.info(
-                    "market_closed_skip",
-                    extra={"symbol": data.symbol, "session": self.session_mgr.current_session, "timestamp": timestamp.isoformat()},
-                )
+            if not self._market_tradable(data.symbol):
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "market_closed_skip",
+                        extra={"symbol": data.symbol, "session": session, "timestamp": ts_iso},
+                    )
                 return decisions
 
+            # Track position closes once the market gate has passed: deals are fetched
+            # since the last check, so closes during a closed-market stretch are picked
+            # up on the next open bar instead of paying MT5 calls on every skipped bar
+            self.track_position_closes()
+
             # Count the bar EARLY so early-return paths still count
             self.processed_bars += 1
 
             # Circuit breaker gate (PR2)
-            if self.session_mgr.session_counters.get("full_sl_hits", 0) >= self.session_mgr.get_max_full_sl_hits():
-                logger.info(
-                    "circuit_breaker_tripped",
-                    extra={"session": self.session_mgr.current_session, "full_sl_hits": self.session_mgr.session_counters.get("full_sl_hits", 0)},
-                )
+            full_sl_hits = counters.get("full_sl_hits", 0)
+            if full_sl_hits >= self._max_full_sl_hits:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "circuit_breaker_tripped",
+                        extra={"session": session, "full_sl_hits": full_sl_hits},
+                    )
                 return decisions
 
             # Volatility pause auto-resume (PR2)
-            if self.session_mgr.clear_pause_if_elapsed(timestamp):
-                logger.info("volatility_pause_cleared", extra={"session": self.session_mgr.current_session, "timestamp": timestamp.isoformat()})
-            if self.session_mgr.is_paused(timestamp):
-                logger.info("volatility_pause_active", extra={"session": self.session_mgr.current_session, "timestamp": timestamp.isoformat()})
+            if sm.clear_pause_if_elapsed(timestamp):
+                logger.info("volatility_pause_cleared", extra={"session": session, "timestamp": ts_iso})
+            if sm.is_paused(timestamp):
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("volatility_pause_active", extra={"session": session, "timestamp": ts_iso})
                 return decisions
 
+            # Columnar float copy of the bars, read by the volatility pause below. Synced
+            # after the market/breaker/pause gates so a bad bar window can only cost this
+            # stage's volatility check, never the gates in front of it
+            columns = self._bar_columns.get(data.symbol)
+            if columns is None:
+                columns = self._bar_columns[data.symbol] = BarColumns(self._bar_capacity, self._vp_lookback)
+            columns.sync(data.bars)
+
+            # ATR(14) once per bar, shared by the volatility pause, the indicator
+            # gate and decision generation
+            atr_val = self._process_indicators(data)
+
             # Volatility pause trigger (spread/ATR) (PR2)
-            vp = self.session_mgr.volatility_pause_cfg or {}
-            if vp.get("enable", False):
-                baseline_spread = self.executor.get_baseline_spread(data.symbol)
-                current_spread = self.executor.get_spread(data.symbol)
-                spread_mult = float((vp.get("spread_multipliers", {}) or {}).get("default", 1.8))
-
-                # ATR now and lookback avg over last N bars
-                lookback = int(vp.get("lookback_bars", 100))
+            if self._vp_enabled:
+                baseline_spread = self._baseline_spread(data.symbol)
+                current_spread = ex.get_spread(data.symbol)
+                spread_mult = self._vp_spread_mult
+
+                # ATR now and lookback avg true range over last N bars; both sides
+                # use true range so overnight gaps do not read as a spike
+                lookback = self._vp_lookback
                 atr_now = None
                 atr_avg = None
-                if len(data.bars) >= max(14, 2):
+                if n_bars >= 14:
                     try:
-                        atr_now = float(compute_atr_simple(list(data.bars)[-15:], 14) or 0)
-                        bars_slice = list(data.bars)[-lookback:]
-                        trs = [float(abs(b.high - b.low)) for b in bars_slice] if bars_slice else []
-                        atr_avg = sum(trs) / len(trs) if trs else 0.0
+                        atr_now = float(atr_val or 0)
+                        n = min(lookback, n_bars, len(columns))
+                        atr_avg = columns.tr_mean(n)
                     except Exception:
                         atr_now = None
                         atr_avg = None
 
-                atr_mult = float(vp.get("atr_spike_multiplier", 2.0))
+                atr_mult = self._vp_atr_mult
                 spread_bad = current_spread > spread_mult * baseline_spread if baseline_spread and current_spread else False
                 atr_bad = (atr_now is not None and atr_avg and atr_avg > 0 and atr_now > atr_mult * atr_avg)
 
                 if spread_bad or atr_bad:
-                    from datetime import timedelta
-                    pause_secs = int(vp.get("min_pause_seconds", 120))
-                    until = timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
-                    self.session_mgr.pause_until(until + timedelta(seconds=pause_secs))
+                    pause_secs = self._vp_pause_secs
+                    sm.pause_until(ts_utc + self._vp_pause_delta)
                     logger.info(
                         "volatility_pause",
                         extra={
-                            "session": self.session_mgr.current_session,
+                            "session": session,
                             "symbol": data.symbol,
                             "spread": current_spread,
                             "baseline_spread": baseline_spread,
@@ -940,7 +1192,7 @@ class TradingPipeline:
                             "atr_avg": atr_avg,
                             "atr_multiplier": atr_mult,
                             "pause_seconds": pause_secs,
-                            "timestamp": timestamp.isoformat(),
+                            "timestamp": ts_iso,
                         },
                     )
                     return decisions
@@ -948,7 +1200,7 @@ class TradingPipeline:
         except Exception as e:
             logger.exception(
                 "pipeline_processing_error",
-                extra={"error": str(e), "symbol": getattr(data, "symbol", None), "timestamp": timestamp.isoformat()},
+                extra={"error": str(e), "symbol": getattr(data, "symbol", None), "timestamp": ts_iso},
             )
 
         try:
@@ -957,8 +1209,10 @@ class TradingPipeline:
                 return decisions
 
             # Indicators
-            if not self._process_indicators(data):
-                return decisions
+            if atr_val is None:
+                atr_val = self._process_indicators(data)
+                if atr_val is None:
+                    return decisions
 
             # Structure detection
             structures = self._process_structure_detection(data)
@@ -966,81 +1220,76 @@ class TradingPipeline:
                 return decisions
 
             # Decision generation (structure-first exit plan + clamps)
-            decisions = self._process_decision_generation(structures, data, timestamp)
-            logger.debug("stage_5_decisions_generated", extra={"count": len(decisions)})
+            if ex.enabled or not self._skip_decisions_when_executor_disabled:
+                decisions = self._process_decision_generation(structures, data, timestamp, atr_val)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("stage_5_decisions_generated", extra={"count": len(decisions)})
 
             # Deduplicate: take only the best decision per bar to prevent multiple orders
             if len(decisions) > 1:
                 original_count = len(decisions)
-                # Sort by confidence score (highest first)
-                decisions = sorted(decisions, key=lambda d: float(d.confidence_score or 0.0), reverse=True)
-                # Keep only the best decision
-                best_decision = decisions[0]
+                # Keep only the best decision by confidence score (first one wins ties,
+                # as with the previous stable descending sort)
+                best_decision = max(decisions, key=lambda d: float(d.confidence_score or 0.0))
                 decisions = [best_decision]
-                logger.info(
-                    "decisions_deduplicated",
-                    extra={
-                        "symbol": data.symbol,
-                        "original_count": original_count,
-                        "kept_count": 1,
-                        "best_structure": best_decision.metadata.get("structure_type", "unknown") if best_decision.metadata else "unknown",
-                        "best_confidence": float(best_decision.confidence_score or 0.0),
-                    },
-                )
-
-            # ---- PR3: Risk sizing + per-symbol open-risk cap, then execute ----
-            if self.executor.enabled and decisions:
-                # Check if daily soft stop has been triggered - if so, skip execution
-                if self._dd_soft_triggered:
+                if logger.isEnabledFor(logging.INFO):
                     logger.info(
-                        "execution_skipped_soft_stop",
+                        "decisions_deduplicated",
                         extra={
                             "symbol": data.symbol,
-                            "reason": "daily_soft_stop_active",
+                            "original_count": original_count,
+                            "kept_count": 1,
+                            "best_structure": best_decision.metadata.get("structure_type", "unknown") if best_decision.metadata else "unknown",
+                            "best_confidence": float(best_decision.confidence_score or 0.0),
                         },
                     )
+
+            # ---- PR3: Risk sizing + per-symbol open-risk cap, then execute ----
+            if ex.enabled and decisions:
+                # Check if daily soft stop has been triggered - if so, skip execution
+                if self._dd_soft_triggered:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "execution_skipped_soft_stop",
+                            extra={
+                                "symbol": data.symbol,
+                                "reason": "daily_soft_stop_active",
+                            },
+                        )
                     return decisions
                 
                 sym = data.symbol
-                meta = self.broker_symbols.get(sym, {})
-                point = float(meta.get("point", 0.0001))
-                # sane defaults: FX 100k, XAU 100
-                contract_size = float(meta.get("contract_size", 0.0)) or (100.0 if sym.upper().startswith("XAU") else 100000.0)
-                min_lot = float(meta.get("volume_min", 0.01))
-                max_lot = float(meta.get("volume_max", 100.0))
-                lot_step = float(meta.get("volume_step", 0.01))
+                sym_meta = self._get_symbol_meta(sym)
+                point = sym_meta.point
 
                 # SAFE equity + open-risk with fallbacks (keeps dry-run alive)
-                if hasattr(self.executor, "get_equity"):
-                    try:
-                        equity = float(self.executor.get_equity())
-                    except Exception:
-                        equity = self.default_equity
-                else:
-                    equity = self.default_equity
-
-                if (
-                    self.executor.mode == ExecutionMode.LIVE
-                    and getattr(self.executor, "enable_real_mt5_orders", False)
-                ):
-                    if self._dd_baseline_equity is None:
-                        self._dd_baseline_equity = equity
-                    if self._dd_baseline_equity and self._dd_baseline_equity > 0:
-                        dd_frac = (equity - self._dd_baseline_equity) / self._dd_baseline_equity
+                equity = self._current_equity()
+
+                # Real-order mode gates both the drawdown block and the post-send
+                # bookkeeping below; it cannot change within a bar
+                live_orders = ex.mode == ExecutionMode.LIVE and getattr(ex, "enable_real_mt5_orders", False)
+
+                if live_orders:
+                    # Drawdown state is read many times below; bind it once per bar
+                    baseline = self._dd_baseline_equity
+                    if baseline is None:
+                        baseline = self._dd_baseline_equity = equity
+                    if baseline and baseline > 0:
+                        dd_frac = (equity - baseline) / baseline
                         if (not self._dd_hard_triggered) and dd_frac <= self._dd_hard_stop_frac:
                             self._dd_hard_triggered = True
                             self._dd_soft_triggered = True
                             try:
-                                self.executor.close_positions([sym])
+                                ex.close_positions([sym])
                             except Exception:
                                 pass
                             logger.info(
                                 "daily_hard_stop_hit",
                                 extra={
-                                    "session": self.session_mgr.current_session,
+                                    "session": session,
                                     "symbol": sym,
                                     "equity": equity,
-                                    "baseline_equity": self._dd_baseline_equity,
+                                    "baseline_equity": baseline,
                                     "dd_frac": float(dd_frac),
                                 },
                             )
@@ -1050,10 +1299,10 @@ class TradingPipeline:
                             logger.info(
                                 "daily_soft_stop_hit",
                                 extra={
-                                    "session": self.session_mgr.current_session,
+                                    "session": session,
                                     "symbol": sym,
                                     "equity": equity,
-                                    "baseline_equity": self._dd_baseline_equity,
+                                    "baseline_equity": baseline,
                                     "dd_frac": float(dd_frac),
                                 },
                             )
@@ -1061,36 +1310,39 @@ class TradingPipeline:
 
                     # FTMO equity-based monitoring (shadow safety layer)
                     # Initialize account start equity if not set
-                    if self._ftmo_account_start_equity is None:
-                        self._ftmo_account_start_equity = equity
+                    start_equity = self._ftmo_account_start_equity
+                    if start_equity is None:
+                        start_equity = self._ftmo_account_start_equity = equity
                     
                     # Track intra-day equity low
-                    if self._ftmo_daily_equity_low is None or equity < self._ftmo_daily_equity_low:
-                        self._ftmo_daily_equity_low = equity
+                    daily_low = self._ftmo_daily_equity_low
+                    if daily_low is None or equity < daily_low:
+                        daily_low = self._ftmo_daily_equity_low = equity
                     
                     # Track all-time equity low
-                    if self._ftmo_total_equity_low is None or equity < self._ftmo_total_equity_low:
-                        self._ftmo_total_equity_low = equity
+                    total_low = self._ftmo_total_equity_low
+                    if total_low is None or equity < total_low:
+                        total_low = self._ftmo_total_equity_low = equity
                     
                     # Compute daily drawdown from baseline (intra-day low)
-                    if self._dd_baseline_equity and self._dd_baseline_equity > 0:
-                        ftmo_daily_dd_pct = ((self._ftmo_daily_equity_low - self._dd_baseline_equity) / self._dd_baseline_equity) * 100.0
+                    if baseline and baseline > 0:
+                        ftmo_daily_dd_pct = ((daily_low - baseline) / baseline) * 100.0
                         
                         # Hard stop at FTMO daily limit (-5%)
                         if (not self._ftmo_daily_stop_triggered) and ftmo_daily_dd_pct <= self._ftmo_max_daily_loss_pct:
                             self._ftmo_daily_stop_triggered = True
                             try:
-                                self.executor.close_positions([sym])
+                                ex.close_positions([sym])
                             except Exception:
                                 pass
                             logger.critical(
                                 "ftmo_daily_limit_hit",
                                 extra={
-                                    "session": self.session_mgr.current_session,
+                                    "session": session,
                                     "symbol": sym,
                                     "equity": equity,
-                                    "daily_equity_low": self._ftmo_daily_equity_low,
-                                    "baseline_equity": self._dd_baseline_equity,
+                                    "daily_equity_low": daily_low,
+                                    "baseline_equity": baseline,
                                     "daily_dd_pct": float(ftmo_daily_dd_pct),
                                     "ftmo_limit_pct": self._ftmo_max_daily_loss_pct,
                                     "env_mode": self._env_mode,
@@ -1104,11 +1356,11 @@ class TradingPipeline:
                             logger.warning(
                                 "approaching_ftmo_daily_limit",
                                 extra={
-                                    "session": self.session_mgr.current_session,
+                                    "session": session,
                                     "symbol": sym,
                                     "equity": equity,
-                                    "daily_equity_low": self._ftmo_daily_equity_low,
-                                    "baseline_equity": self._dd_baseline_equity,
+                                    "daily_equity_low": daily_low,
+                                    "baseline_equity": baseline,
                                     "daily_dd_pct": float(ftmo_daily_dd_pct),
                                     "warning_threshold_pct": self._ftmo_daily_warning_pct,
                                     "ftmo_limit_pct": self._ftmo_max_daily_loss_pct,
@@ -1117,24 +1369,24 @@ class TradingPipeline:
                             )
                     
                     # Compute total drawdown from account start (all-time low)
-                    if self._ftmo_account_start_equity and self._ftmo_account_start_equity > 0:
-                        ftmo_total_dd_pct = ((self._ftmo_total_equity_low - self._ftmo_account_start_equity) / self._ftmo_account_start_equity) * 100.0
+                    if start_equity and start_equity > 0:
+                        ftmo_total_dd_pct = ((total_low - start_equity) / start_equity) * 100.0
                         
                         # Hard stop at FTMO total limit (-10%)
                         if (not self._ftmo_total_stop_triggered) and ftmo_total_dd_pct <= self._ftmo_max_total_loss_pct:
                             self._ftmo_total_stop_triggered = True
                             try:
-                                self.executor.close_positions([sym])
+                                ex.close_positions([sym])
                             except Exception:
                                 pass
                             logger.critical(
                                 "ftmo_total_limit_hit",
                                 extra={
-                                    "session": self.session_mgr.current_session,
+                                    "session": session,
                                     "symbol": sym,
                                     "equity": equity,
-                                    "total_equity_low": self._ftmo_total_equity_low,
-                                    "account_start_equity": self._ftmo_account_start_equity,
+                                    "total_equity_low": total_low,
+                                    "account_start_equity": start_equity,
                                     "total_dd_pct": float(ftmo_total_dd_pct),
                                     "ftmo_limit_pct": self._ftmo_max_total_loss_pct,
                                     "env_mode": self._env_mode,
@@ -1148,11 +1400,11 @@ class TradingPipeline:
                             logger.warning(
                                 "approaching_ftmo_total_limit",
                                 extra={
-                                    "session": self.session_mgr.current_session,
+                                    "session": session,
                                     "symbol": sym,
                                     "equity": equity,
-                                    "total_equity_low": self._ftmo_total_equity_low,
-                                    "account_start_equity": self._ftmo_account_start_equity,
+                                    "total_equity_low": total_low,
+                                    "account_start_equity": start_equity,
                                     "total_dd_pct": float(ftmo_total_dd_pct),
                                     "warning_threshold_pct": self._ftmo_total_warning_pct,
                                     "ftmo_limit_pct": self._ftmo_max_total_loss_pct,
@@ -1164,25 +1416,15 @@ class TradingPipeline:
                         logger.info(
                             "order_send_failure_pause",
                             extra={
-                                "session": self.session_mgr.current_session,
+                                "session": session,
                                 "symbol": sym,
                                 "consecutive_failures": self._consecutive_send_failures,
                             },
                         )
                         return decisions
 
-                if hasattr(self.executor, "get_open_risk_by_symbol"):
-                    try:
-                        open_risk_before_fn = self.executor.get_open_risk_by_symbol
-                    except Exception:
-                        open_risk_before_fn = None
-                else:
-                    open_risk_before_fn = None
-
-                per_trade_pct = float(self.risk_cfg.get("per_trade_pct", 0.0025))
-                cap_pct = float(self.risk_cfg.get("per_symbol_open_risk_cap_pct", 0.0075))
-                risk_budget = max(equity * per_trade_pct, 0.0)
-                cap_budget = equity * cap_pct
+                per_trade_pct = self._per_trade_pct
+                cap_pct = self._cap_pct
 
                 # Optional probation overrides (no-op for now; future PR may adjust risk caps/RR)
                 if self.onboarding_mgr is not None:
@@ -1191,21 +1433,55 @@ class TradingPipeline:
                             "per_trade_pct": per_trade_pct,
                             "per_symbol_open_risk_cap_pct": cap_pct,
                         })
-                        per_trade_pct = float(derived_risk_cfg.get("per_trade_pct", per_trade_pct))
-                        cap_pct = float(derived_risk_cfg.get("per_symbol_open_risk_cap_pct", cap_pct))
-                        risk_budget = max(equity * per_trade_pct, 0.0)
-                        cap_budget = equity * cap_pct
+                        derived_per_trade_pct = float(derived_risk_cfg.get("per_trade_pct", per_trade_pct))
+                        derived_cap_pct = float(derived_risk_cfg.get("per_symbol_open_risk_cap_pct", cap_pct))
+                        per_trade_pct, cap_pct = derived_per_trade_pct, derived_cap_pct
                     except Exception:
                         # If onboarding manager fails, fall back to original risk config
                         pass
 
+                risk_budget = max(equity * per_trade_pct, 0.0)
+                cap_budget = equity * cap_pct
+
+                # Orders that pass every guard are queued and submitted together below
+                pending_orders: List[Dict[str, Any]] = []
+                pending_context: List[Tuple[Decision, Dict[str, Any], str, float]] = []
+                pending_risk = 0.0
+
+                # Booked open risk and symbol constants are fixed for the whole loop; fetch once
+                open_risk_booked = 0.0
+                if self._get_open_risk is not None:
+                    try:
+                        open_risk_booked = float(self._get_open_risk(sym))
+                    except Exception:
+                        open_risk_booked = 0.0
+                point_value_per_lot = sym_meta.point_value_per_lot
+                point_divisor = max(point, 1e-12)
+                sl_hard_floor_points = sym_meta.sl_hard_floor_points
+
                 for idx, decision in enumerate(decisions):
-                    stop_distance_points = abs(float(decision.entry_price) - float(decision.stop_loss)) / max(point, 1e-12)
+                    # Once queued orders use up the cap, no later decision can pass it
+                    if pending_orders and open_risk_booked + pending_risk >= cap_budget:
+                        logger.info(
+                            "risk_cap_hit",
+                            extra={
+                                "session": session,
+                                "symbol": sym,
+                                "open_risk": open_risk_booked + pending_risk,
+                                "cap_pct": cap_pct,
+                                "equity": equity,
+                                "skipped_decisions": len(decisions) - idx,
+                            },
+                        )
+                        break
+
+                    # Exact Decimal difference, converted to float once for the float risk math
+                    stop_distance_points = float(abs(decision.entry_price - decision.stop_loss)) / point_divisor
                     if stop_distance_points <= 0:
                         logger.info(
                             "risk_too_small",
                             extra={
-                                "session": self.session_mgr.current_session,
+                                "session": session,
                                 "symbol": sym,
                                 "equity": equity,
                                 "per_trade_pct": per_trade_pct,
@@ -1215,12 +1491,11 @@ class TradingPipeline:
                         continue
 
                     # Reject setups with SL tighter than broker hard floor before sizing
-                    sl_hard_floor_points = float(meta.get("sl_hard_floor_points", 0))
                     if sl_hard_floor_points > 0 and stop_distance_points < sl_hard_floor_points:
                         logger.info(
                             "setup_rejected_tight_sl",
                             extra={
-                                "session": self.session_mgr.current_session,
+                                "session": session,
                                 "symbol": sym,
                                 "stop_distance_points": stop_distance_points,
                                 "sl_hard_floor_points": sl_hard_floor_points,
@@ -1229,38 +1504,31 @@ class TradingPipeline:
                         )
                         continue
 
-                    point_value_per_lot = contract_size * point
-                    volume_raw = risk_budget / max((stop_distance_points * point_value_per_lot), 1e-12)
-                    steps = max(int(volume_raw / lot_step), 0)
-                    volume_rounded = steps * lot_step
-                    if volume_rounded < min_lot:
+                    volume_raw, position_size = _size_volume(risk_budget, stop_distance_points, sym_meta)
+                    if position_size is None:
                         logger.info(
                             "risk_too_small",
                             extra={
-                                "session": self.session_mgr.current_session,
+                                "session": session,
                                 "symbol": sym,
                                 "equity": equity,
                                 "per_trade_pct": per_trade_pct,
-                                "min_lot": min_lot,
+                                "min_lot": sym_meta.min_lot,
                                 "computed_volume": volume_raw,
                             },
                         )
                         continue
-                    volume_rounded = min(volume_rounded, max_lot)
 
+                    volume_rounded = float(position_size)
                     new_trade_risk = stop_distance_points * point_value_per_lot * volume_rounded
-                    open_risk_before = 0.0
-                    if open_risk_before_fn:
-                        try:
-                            open_risk_before = float(open_risk_before_fn(sym))
-                        except Exception:
-                            open_risk_before = 0.0
+                    # Risk of orders queued earlier in this bar is not booked by the executor yet
+                    open_risk_before = open_risk_booked + pending_risk
 
                     if open_risk_before + new_trade_risk > cap_budget:
                         logger.info(
                             "risk_cap_hit",
                             extra={
-                                "session": self.session_mgr.current_session,
+                                "session": session,
                                 "symbol": sym,
                                 "open_risk": open_risk_before,
                                 "new_trade_risk": new_trade_risk,
@@ -1270,15 +1538,20 @@ class TradingPipeline:
                         )
                         continue
 
-                    # Build a new sized Decision (frozen dataclass safe)
-                    new_meta = dict(decision.metadata or {})
-                    new_meta["risk"] = {
-                        "new_trade_risk": float(new_trade_risk),
-                        "open_risk_before": float(open_risk_before),
-                        "cap_pct": float(cap_pct),
-                        "equity": float(equity),
-                        "stop_distance_points": float(stop_distance_points),
-                        "volume_rounded": float(volume_rounded),
+                    # Build a new sized Decision (frozen dataclass safe). An explicit
+                    # constructor call is about 2x cheaper than dataclasses.replace,
+                    # which walks fields() and getattr()s every one of them.
+                    # All risk figures below are already floats.
+                    new_meta = {
+                        **(decision.metadata or {}),
+                        "risk": {
+                            "new_trade_risk": new_trade_risk,
+                            "open_risk_before": open_risk_before,
+                            "cap_pct": cap_pct,
+                            "equity": equity,
+                            "stop_distance_points": stop_distance_points,
+                            "volume_rounded": volume_rounded,
+                        },
                     }
 
                     sized_decision = Decision(
@@ -1289,7 +1562,7 @@ class TradingPipeline:
                         entry_price=decision.entry_price,
                         stop_loss=decision.stop_loss,
                         take_profit=decision.take_profit,
-                        position_size=Decimal(str(volume_rounded)),
+                        position_size=position_size,
                         risk_reward_ratio=decision.risk_reward_ratio,
                         structure_id=decision.structure_id,
                         confidence_score=decision.confidence_score,
@@ -1301,21 +1574,22 @@ class TradingPipeline:
                     decisions[idx] = sized_decision
 
                     # Explicit structured log of final sized trade (for PR3 artifacts)
-                    logger.info(
-                        "execution_sized",
-                        extra={
-                            "symbol": sym,
-                            "order_type": sized_decision.decision_type.value,
-                            "volume_rounded": float(sized_decision.position_size),
-                            "risk": sized_decision.metadata.get("risk", {}),
-                            "risk_budget": float(risk_budget),
-                            "cap_budget": float(cap_budget),
-                            "session": self.session_mgr.current_session,
-                            "entry": float(sized_decision.entry_price),
-                            "sl": float(sized_decision.stop_loss),
-                            "tp": float(sized_decision.take_profit),
-                        },
-                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "execution_sized",
+                            extra={
+                                "symbol": sym,
+                                "order_type": sized_decision.decision_type.value,
+                                "volume_rounded": float(sized_decision.position_size),
+                                "risk": sized_decision.metadata.get("risk", {}),
+                                "risk_budget": float(risk_budget),
+                                "cap_budget": float(cap_budget),
+                                "session": session,
+                                "entry": float(sized_decision.entry_price),
+                                "sl": float(sized_decision.stop_loss),
+                                "tp": float(sized_decision.take_profit),
+                            },
+                        )
 
                     should_exec = True
                     onboarding_state = None
@@ -1327,6 +1601,10 @@ class TradingPipeline:
                             should_exec = True
 
                     if should_exec:
+                        # LIVE guards below query MT5 one after another and stop at the
+                        # first block, so later guards' IPC is often skipped entirely;
+                        # the MetaTrader5 client is a single terminal connection, so
+                        # the calls are not fanned out to threads
                         # NEW: Margin and risk guard before execution
                         can_trade, margin_reason = self.check_margin_and_risk_before_trade(
                             symbol=sym,
@@ -1348,12 +1626,9 @@ class TradingPipeline:
                         direction_str = sized_decision.decision_type.value
                         structure_type = sized_decision.metadata.get("structure_type", "unknown")
                         
-                        # Check for direction-specific threshold first (e.g., rejection_buy)
-                        # Falls back to general structure threshold if direction-specific not found
-                        direction_specific_key = f"{structure_type}_{direction_str.lower()}"
-                        structure_threshold = self._structure_thresholds.get(direction_specific_key)
-                        if structure_threshold is None:
-                            structure_threshold = self._structure_thresholds.get(structure_type)
+                        # Direction-specific threshold (e.g., rejection_buy) if configured,
+                        # else the general structure threshold; resolved at init
+                        structure_threshold = self._structure_threshold_by_side.get((structure_type, direction_str))
                         
                         if structure_threshold is not None:
                             current_confidence = float(sized_decision.confidence_score)
@@ -1389,9 +1664,7 @@ class TradingPipeline:
                         
                         if threshold_bump > 0:
                             # Get base threshold from config based on current session
-                            current_session = self.session_mgr.current_session if self.session_mgr else "LONDON"
-                            scales = (self.config.structure_configs or {}).get("scoring", {}).get("scales", {})
-                            session_config = scales.get("M15", {}).get("fx", {}).get(current_session, {})
+                            session_config = self._conflict_session_scales.get(session) or _EMPTY
                             base_threshold = float(session_config.get("min_composite", 0.45))
                             required_threshold = base_threshold + threshold_bump
                             
@@ -1448,92 +1721,119 @@ class TradingPipeline:
                                 })
                                 continue  # Skip this trade
                         
-                        execution_result = self.executor.execute_order(
-                            symbol=sym,
-                            order_type=sized_decision.decision_type.value,
-                            volume=float(sized_decision.position_size),
-                            entry_price=float(sized_decision.entry_price),
-                            stop_loss=float(sized_decision.stop_loss),
-                            take_profit=float(sized_decision.take_profit),
-                            comment=f"DEVI_{sized_decision.metadata.get('structure_type', 'UNKNOWN')}",
-                            magic=0,
-                        )
-                        self.execution_results.append(execution_result)
+                        order_comment = _order_comment(sized_decision.metadata.get("structure_type"))
+                        pending_orders.append({
+                            "symbol": sym,
+                            "order_type": sized_decision.decision_type.value,
+                            "volume": float(sized_decision.position_size),
+                            "entry_price": float(sized_decision.entry_price),
+                            "stop_loss": float(sized_decision.stop_loss),
+                            "take_profit": float(sized_decision.take_profit),
+                            "comment": order_comment,
+                            "magic": 0,
+                        })
+                        pending_context.append((sized_decision, htf_details, order_comment, new_trade_risk))
+                        pending_risk += new_trade_risk
+                    else:
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info(
+                                "symbol_onboarding_state",
+                                extra={
+                                    "symbol": sym,
+                                    "state": (onboarding_state or {}).get("state", "observe_only"),
+                                    "execute": False,
+                                    "reason": "observe_only",
+                                    "sessions_seen": (onboarding_state or {}).get("sessions_seen"),
+                                    "trades_seen": (onboarding_state or {}).get("trades_seen"),
+                                    "validation_errors": (onboarding_state or {}).get("validation_errors"),
+                                },
+                            )
 
-                        # Enhanced exit logging for FTMO analysis
-                        if getattr(execution_result, "success", False):
-                            meta = sized_decision.metadata
-                            entry = float(sized_decision.entry_price)
-                            sl_final = float(sized_decision.stop_loss)
-                            tp_final = float(sized_decision.take_profit)
-                            point = float(self.broker_symbols.get(sym, {}).get("point", 0.0001))
-                            
-                            # Calculate distances in points
-                            if sized_decision.decision_type == DecisionType.BUY:
-                                sl_distance_points = (entry - sl_final) / point if point > 0 else 0
-                                tp_distance_points = (tp_final - entry) / point if point > 0 else 0
-                            else:
-                                sl_distance_points = (sl_final - entry) / point if point > 0 else 0
-                                tp_distance_points = (entry - tp_final) / point if point > 0 else 0
-                            
-                            # Calculate intended RR
-                            risk_dist = abs(entry - sl_final)
-                            reward_dist = abs(tp_final - entry)
-                            intended_rr = reward_dist / risk_dist if risk_dist > 0 else 0
-                            
-                            # Get session context for trade journal
-                            session_name = ""
-                            session_relevance = ""
-                            if self.session_filter is not None:
+                # Submit every order that cleared the guards in one executor call
+                if pending_orders:
+                    execution_results = ex.execute_orders_batch(pending_orders)
+                    self.execution_results.extend(execution_results)
+                else:
+                    execution_results = []
+
+                for (sized_decision, htf_details, order_comment, new_trade_risk), execution_result in zip(
+                    pending_context, execution_results
+                ):
+                    # Enhanced exit logging for FTMO analysis
+                    if getattr(execution_result, "success", False):
+                        meta = sized_decision.metadata
+                        entry = float(sized_decision.entry_price)
+                        sl_final = float(sized_decision.stop_loss)
+                        tp_final = float(sized_decision.take_profit)
+                        point = sym_meta.point
+                        
+                        # Calculate distances in points
+                        if sized_decision.decision_type == DecisionType.BUY:
+                            sl_distance_points = (entry - sl_final) / point if point > 0 else 0
+                            tp_distance_points = (tp_final - entry) / point if point > 0 else 0
+                        else:
+                            sl_distance_points = (sl_final - entry) / point if point > 0 else 0
+                            tp_distance_points = (entry - tp_final) / point if point > 0 else 0
+                        
+                        # Calculate intended RR
+                        risk_dist = abs(entry - sl_final)
+                        reward_dist = abs(tp_final - entry)
+                        intended_rr = reward_dist / risk_dist if risk_dist > 0 else 0
+                        
+                        # Get session context for trade journal
+                        session_name = ""
+                        session_relevance = ""
+                        if self.session_filter is not None:
+                            try:
+                                session_name, session_relevance, _ = self.session_filter.evaluate(
+                                    symbol=sym,
+                                    direction=sized_decision.decision_type.value,
+                                    structure_type=meta.get("structure_type", "unknown"),
+                                    confidence=float(sized_decision.confidence_score)
+                                )
+                            except Exception:
+                                pass
+                        
+                        # Cache entry in trade journal for outcome tracking
+                        if self.trade_journal is not None:
+                            ticket = getattr(execution_result, "order_id", None)
+                            if ticket:
                                 try:
-                                    session_name, session_relevance, _ = self.session_filter.evaluate(
+                                    # Compute HTF distance in ATR units
+                                    htf_distance_atr = None
+                                    ema = htf_details.get('ema')
+                                    atr = htf_details.get('atr')
+                                    current_close = htf_details.get('current_close')
+                                    if ema and atr and current_close and atr > 0:
+                                        htf_distance_atr = round(abs(current_close - ema) / atr, 3)
+                                    
+                                    self.trade_journal.cache_entry(
+                                        ticket=ticket,
                                         symbol=sym,
                                         direction=sized_decision.decision_type.value,
                                         structure_type=meta.get("structure_type", "unknown"),
-                                        confidence=float(sized_decision.confidence_score)
+                                        entry_price=entry,
+                                        sl=sl_final,
+                                        tp=tp_final,
+                                        volume=float(sized_decision.position_size),
+                                        intended_rr=intended_rr,
+                                        magic=0,
+                                        comment=order_comment,
+                                        session_name=session_name,
+                                        session_relevance=session_relevance,
+                                        htf_bias=htf_details.get('htf_bias', ''),
+                                        htf_alignment=htf_details.get('alignment', ''),
+                                        htf_distance_atr=htf_distance_atr,
+                                        htf_clear_trend=htf_details.get('is_clear_trend')
                                     )
-                                except Exception:
-                                    pass
-                            
-                            # Cache entry in trade journal for outcome tracking
-                            if self.trade_journal is not None:
-                                ticket = getattr(execution_result, "order_id", None)
-                                if ticket:
-                                    try:
-                                        # Compute HTF distance in ATR units
-                                        htf_distance_atr = None
-                                        ema = htf_details.get('ema')
-                                        atr = htf_details.get('atr')
-                                        current_close = htf_details.get('current_close')
-                                        if ema and atr and current_close and atr > 0:
-                                            htf_distance_atr = round(abs(current_close - ema) / atr, 3)
-                                        
-                                        self.trade_journal.cache_entry(
-                                            ticket=ticket,
-                                            symbol=sym,
-                                            direction=sized_decision.decision_type.value,
-                                            structure_type=meta.get("structure_type", "unknown"),
-                                            entry_price=entry,
-                                            sl=sl_final,
-                                            tp=tp_final,
-                                            volume=float(sized_decision.position_size),
-                                            intended_rr=intended_rr,
-                                            magic=0,
-                                            comment=f"DEVI_{meta.get('structure_type', 'UNKNOWN')}",
-                                            session_name=session_name,
-                                            session_relevance=session_relevance,
-                                            htf_bias=htf_details.get('htf_bias', ''),
-                                            htf_alignment=htf_details.get('alignment', ''),
-                                            htf_distance_atr=htf_distance_atr,
-                                            htf_clear_trend=htf_details.get('is_clear_trend')
-                                        )
-                                    except Exception as je:
-                                        logger.warning("trade_journal_cache_failed", extra={
-                                            "ticket": ticket,
-                                            "symbol": sym,
-                                            "error": str(je)
-                                        })
-                            
+                                except Exception as je:
+                                    logger.warning("trade_journal_cache_failed", extra={
+                                        "ticket": ticket,
+                                        "symbol": sym,
+                                        "error": str(je)
+                                    })
+                        
+                        if logger.isEnabledFor(logging.INFO):
                             logger.info(
                                 "trade_executed_enhanced",
                                 extra={
@@ -1552,58 +1852,42 @@ class TradingPipeline:
                                     "clamped": meta.get("clamped", False),
                                     "volume": float(sized_decision.position_size),
                                     "env_mode": meta.get("env_mode", "unknown"),
-                                    "session": self.session_mgr.current_session,
+                                    "session": session,
                                 },
                             )
 
+                    if live_orders:
+                        if getattr(execution_result, "success", False):
+                            # Reset failure counter on success
+                            self._consecutive_send_failures = 0
+                            self._last_failure_time = None
+                        elif not getattr(execution_result, "precheck_block", False):
+                            # Only count actual broker failures, not pre-check blocks
+                            self._consecutive_send_failures += 1
+                            self._last_failure_time = time.monotonic()
+                        
+                        # Cooldown reset: if enough time passed since last failure, reset counter
+                        # This prevents temporary market conditions from killing the whole session
                         if (
-                            self.executor.mode == ExecutionMode.LIVE
-                            and getattr(self.executor, "enable_real_mt5_orders", False)
+                            self._last_failure_time is not None
+                            and self._consecutive_send_failures > 0
                         ):
-                            if getattr(execution_result, "success", False):
-                                # Reset failure counter on success
+                            elapsed = time.monotonic() - self._last_failure_time
+                            if elapsed > self._failure_cooldown_seconds:
+                                logger.info("failure_counter_cooldown_reset", extra={
+                                    "previous_failures": self._consecutive_send_failures,
+                                    "elapsed_seconds": elapsed,
+                                    "cooldown_seconds": self._failure_cooldown_seconds,
+                                })
                                 self._consecutive_send_failures = 0
                                 self._last_failure_time = None
-                            elif not getattr(execution_result, "precheck_block", False):
-                                # Only count actual broker failures, not pre-check blocks
-                                self._consecutive_send_failures += 1
-                                self._last_failure_time = datetime.now(timezone.utc)
-                            
-                            # Cooldown reset: if enough time passed since last failure, reset counter
-                            # This prevents temporary market conditions from killing the whole session
-                            if (
-                                self._last_failure_time is not None
-                                and self._consecutive_send_failures > 0
-                            ):
-                                elapsed = (datetime.now(timezone.utc) - self._last_failure_time).total_seconds()
-                                if elapsed > self._failure_cooldown_seconds:
-                                    logger.info("failure_counter_cooldown_reset", extra={
-                                        "previous_failures": self._consecutive_send_failures,
-                                        "elapsed_seconds": elapsed,
-                                        "cooldown_seconds": self._failure_cooldown_seconds,
-                                    })
-                                    self._consecutive_send_failures = 0
-                                    self._last_failure_time = None
 
-                        # Track open-risk accumulation in dry-run if executor supports it
-                        if getattr(execution_result, "success", False) and hasattr(self.executor, "add_open_risk"):
-                            try:
-                                self.executor.add_open_risk(sym, new_trade_risk)
-                            except Exception:
-                                pass
-                    else:
-                        logger.info(
-                            "symbol_onboarding_state",
-                            extra={
-                                "symbol": sym,
-                                "state": (onboarding_state or {}).get("state", "observe_only"),
-                                "execute": False,
-                                "reason": "observe_only",
-                                "sessions_seen": (onboarding_state or {}).get("sessions_seen"),
-                                "trades_seen": (onboarding_state or {}).get("trades_seen"),
-                                "validation_errors": (onboarding_state or {}).get("validation_errors"),
-                            },
-                        )
+                    # Track open-risk accumulation in dry-run if executor supports it
+                    if getattr(execution_result, "success", False) and self._add_open_risk is not None:
+                        try:
+                            self._add_open_risk(sym, new_trade_risk)
+                        except Exception:
+                            pass
 
                 # Record onboarding counters after processing sized decisions
                 if self.onboarding_mgr is not None and decisions:
@@ -1611,7 +1895,7 @@ class TradingPipeline:
                         self.onboarding_mgr.record_decisions(
                             symbol=sym,
                             decisions=decisions,
-                            session_id=self.session_mgr.current_session if self.session_mgr else None,
+                            session_id=session,
                             validation_errors=0,
                         )
                     except Exception:
@@ -1621,49 +1905,183 @@ class TradingPipeline:
             self.decisions_generated += len(decisions)
 
             # Session counters (PR1)
-            self.session_mgr.session_counters["decisions_attempted"] += len(structures)
-            self.session_mgr.session_counters["decisions_accepted"] += len(decisions)
-            logger.info(
-                "session_counters",
-                extra={
-                    "session": self.session_mgr.current_session,
-                    "decisions_attempted": self.session_mgr.session_counters["decisions_attempted"],
-                    "decisions_accepted": self.session_mgr.session_counters["decisions_accepted"],
-                    "timestamp": timestamp.isoformat(),
-                },
-            )
+            counters["decisions_attempted"] += len(structures)
+            counters["decisions_accepted"] += len(decisions)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "session_counters",
+                    extra={
+                        "session": session,
+                        "decisions_attempted": counters["decisions_attempted"],
+                        "decisions_accepted": counters["decisions_accepted"],
+                        "timestamp": ts_iso,
+                    },
+                )
 
         except Exception as e:
             logger.exception(
                 "pipeline_processing_error",
-                extra={"error": str(e), "symbol": getattr(data, "symbol", None), "timestamp": timestamp.isoformat()},
+                extra={"error": str(e), "symbol": getattr(data, "symbol", None), "timestamp": ts_iso},
             )
 
         return decisions
 
     def _process_pre_filters(self, data: OHLCV) -> bool:
-        is_test_mode = self.config.system_configs.get("synthetic_mode", False) or \
-                       self.config.system_configs.get("data_source") in ["synthetic", "csv"]
-        min_bars = 5 if is_test_mode else 50
-        return len(data.bars) >= min_bars
+        return len(data.bars) >= self._min_bars
 
-    def _process_indicators(self, data: OHLCV) -> bool:
-        atr = compute_atr_simple(list(data.bars), 14)
-        return atr is not None
+    def _current_equity(self) -> float:
+        """Executor equity, falling back to the configured default."""
+        if self._get_equity is None:
+            return self.default_equity
+        try:
+            return float(self._get_equity())
+        except Exception:
+            return self.default_equity
+
+    def _market_tradable(self, symbol: str) -> bool:
+        """Combined is_market_open/is_symbol_tradable check, cached per symbol."""
+        now = time.monotonic()
+        cached = self._market_open_cache.get(symbol)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        ex = self.executor
+        tradable = bool(ex.is_market_open() and ex.is_symbol_tradable(symbol))
+        self._market_open_cache[symbol] = (now + self._market_open_ttl, tradable)
+        return tradable
+
+    def _baseline_spread(self, symbol: str) -> float:
+        """Executor baseline spread for a symbol, cached per symbol."""
+        now = time.monotonic()
+        cached = self._baseline_spread_cache.get(symbol)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        spread = self.executor.get_baseline_spread(symbol)
+        self._baseline_spread_cache[symbol] = (now + self._baseline_spread_ttl, spread)
+        return spread
+
+    def _get_symbol_meta(self, symbol: str) -> _SymbolMeta:
+        """Parsed broker metadata for a symbol, cached after first use."""
+        sym_meta = self._symbol_meta.get(symbol)
+        if sym_meta is None:
+            sym_meta = _SymbolMeta.from_config(symbol, self.broker_symbols.get(symbol, _EMPTY))
+            self._symbol_meta[symbol] = sym_meta
+        return sym_meta
+
+    def _current_atr(self, data: OHLCV) -> Optional[Decimal]:
+        """ATR(14) for the latest bar, maintained incrementally per symbol."""
+        atr = self._atr_state.get(data.symbol)
+        if atr is None:
+            atr = self._atr_state[data.symbol] = IncrementalATR(14)
+        return atr.update(data.bars)
+
+    def _process_indicators(self, data: OHLCV) -> Optional[Decimal]:
+        """ATR(14) for the bar, or None while history is too short."""
+        return self._current_atr(data)
 
     def _process_structure_detection(self, data: OHLCV) -> List[Structure]:
         return self.structure_manager.detect_structures(data, "test_session")
 
-    def _process_decision_generation(self, structures: List[Structure], data: OHLCV, timestamp: datetime) -> List[Decision]:
+    @staticmethod
+    def _build_structures_map(structures: List[Structure], entry_price: Decimal) -> Dict[str, Any]:
+        """Nearest order block / FVG / rejection to entry, shaped for StructureExitPlanner.plan."""
+        nearest: Dict[str, Tuple[Decimal, Structure]] = {}
+        for struct in structures:
+            stype = struct.structure_type.value
+            if stype in _PLANNER_STRUCTURE_TYPES:
+                dist = abs(struct.midpoint - entry_price)
+                best = nearest.get(stype)
+                # strict < keeps the first of equally near structures, like min()
+                if best is None or dist < best[0]:
+                    nearest[stype] = (dist, struct)
+
+        ob = nearest["order_block"][1] if "order_block" in nearest else None
+        fvg = nearest["fair_value_gap"][1] if "fair_value_gap" in nearest else None
+        uzr = nearest["rejection"][1] if "rejection" in nearest else None
+
+        structures_map = {}
+        if ob:
+            meta = ob.metadata
+            hi, lo = ob.high_price, ob.low_price
+            upper = meta.get("upper_edge", max(hi, lo))
+            lower = meta.get("lower_edge", min(hi, lo))
+            structures_map["order_block"] = {
+                "nearest": {
+                    "upper_edge": _as_decimal(upper),
+                    "lower_edge": _as_decimal(lower),
+                    "side": "BUY" if ob.is_bullish else "SELL",
+                    "age": int(meta.get("age_bars", 0)),
+                    "quality": _as_decimal(ob.quality_score),
+                }
+            }
+        if fvg:
+            meta = fvg.metadata
+            hi, lo = fvg.high_price, fvg.low_price
+            low = meta.get("gap_low", min(hi, lo))
+            high = meta.get("gap_high", max(hi, lo))
+            structures_map["fair_value_gap"] = {
+                "nearest": {
+                    "gap_low": _as_decimal(low),
+                    "gap_high": _as_decimal(high),
+                    "side": "BUY" if fvg.is_bullish else "SELL",
+                    "age": int(meta.get("age_bars", 0)),
+                    "quality": _as_decimal(fvg.quality_score),
+                }
+            }
+        if uzr:
+            # UZR zone boundaries are the high/low of the rejection structure
+            hi, lo = uzr.high_price, uzr.low_price
+            zone_low = min(hi, lo)
+            zone_high = max(hi, lo)
+            structures_map["rejection"] = {
+                "nearest": {
+                    "zone_low": _as_decimal(zone_low),
+                    "zone_high": _as_decimal(zone_high),
+                    "side": "BUY" if uzr.is_bullish else "SELL",
+                    "age": int(uzr.metadata.get("age_bars", 0)),
+                    "quality": _as_decimal(uzr.quality_score),
+                }
+            }
+        return structures_map
+
+    def _process_decision_generation(
+        self,
+        structures: List[Structure],
+        data: OHLCV,
+        timestamp: datetime,
+        atr_val: Optional[Decimal] = None,
+    ) -> List[Decision]:
+        """
+        Build one validated Decision per structure.
+
+        SL/TP/RR are computed in Decimal so they agree exactly with the exit
+        planner and the sizer; the loop runs over a handful of structures per
+        bar, so its cost is dominated by Decision construction, not arithmetic.
+        """
         decisions: List[Decision] = []
 
-        atr_val = compute_atr_simple(list(data.bars), 14)
-        atr_val = Decimal(str(atr_val)) if atr_val is not None else None
+        if atr_val is None:
+            atr_val = self._current_atr(data)
         entry_price = data.latest_bar.close
 
+        # Nearest OB/FVG/UZR depend only on the bar's entry price, so the
+        # planner input is built once per bar rather than once per structure
+        structures_map = None
+        plans_by_side: Dict[str, Optional[Dict[str, Any]]] = {}
+        if self.exit_planner and atr_val is not None and getattr(self.exit_planner, "cfg", {}).get("enabled", False):
+            try:
+                structures_map = self._build_structures_map(structures, entry_price)
+            except Exception as e:
+                logger.exception("decision_generation_error", extra={"error": str(e)})
+                return decisions
+
         for structure in structures:
             try:
-                decision_type = DecisionType.BUY if structure.is_bullish else DecisionType.SELL
+                # Properties/enum values read several times below, bound once per structure
+                is_buy = structure.is_bullish
+                st_value = structure.structure_type.value
+                price_range = structure.price_range
+                decision_type = DecisionType.BUY if is_buy else DecisionType.SELL
+                side_str = "BUY" if is_buy else "SELL"
 
                 # Defaults
                 planned_sl = None
@@ -1675,60 +2093,17 @@ class TradingPipeline:
                 clamped = False
 
                 # Structure-first exit planning (if enabled and ATR available)
-                if self.exit_planner and atr_val is not None and getattr(self.exit_planner, "cfg", {}).get("enabled", False):
-                    side_str = "BUY" if decision_type == DecisionType.BUY else "SELL"
-
-                    def _nearest(structs, t):
-                        c = [s for s in structs if s.structure_type.value == t]
-                        return min(c, key=lambda s: abs(s.midpoint - entry_price)) if c else None
-
-                    ob = _nearest(structures, "order_block")
-                    fvg = _nearest(structures, "fair_value_gap")
-                    uzr = _nearest(structures, "rejection")
-
-                    structures_map = {}
-                    if ob:
-                        upper = ob.metadata.get("upper_edge", max(ob.high_price, ob.low_price))
-                        lower = ob.metadata.get("lower_edge", min(ob.high_price, ob.low_price))
-                        structures_map["order_block"] = {
-                            "nearest": {
-                                "upper_edge": Decimal(str(upper)),
-                                "lower_edge": Decimal(str(lower)),
-                                "side": "BUY" if ob.is_bullish else "SELL",
-                                "age": int(ob.metadata.get("age_bars", 0)),
-                                "quality": Decimal(str(ob.quality_score)),
-                            }
-                        }
-                    if fvg:
-                        low = fvg.metadata.get("gap_low", min(fvg.high_price, fvg.low_price))
-                        high = fvg.metadata.get("gap_high", max(fvg.high_price, fvg.low_price))
-                        structures_map["fair_value_gap"] = {
-                            "nearest": {
-                                "gap_low": Decimal(str(low)),
-                                "gap_high": Decimal(str(high)),
-                                "side": "BUY" if fvg.is_bullish else "SELL",
-                                "age": int(fvg.metadata.get("age_bars", 0)),
-                                "quality": Decimal(str(fvg.quality_score)),
-                            }
-                        }
-                    if uzr:
-                        # UZR zone boundaries are the high/low of the rejection structure
-                        zone_low = min(uzr.high_price, uzr.low_price)
-                        zone_high = max(uzr.high_price, uzr.low_price)
-                        structures_map["rejection"] = {
-                            "nearest": {
-                                "zone_low": Decimal(str(zone_low)),
-                                "zone_high": Decimal(str(zone_high)),
-                                "side": "BUY" if uzr.is_bullish else "SELL",
-                                "age": int(uzr.metadata.get("age_bars", 0)),
-                                "quality": Decimal(str(uzr.quality_score)),
-                            }
-                        }
-
-                    plan = self.exit_planner.plan(side=side_str, entry=entry_price, atr=atr_val, structures=structures_map)
+                if structures_map is not None:
+                    # Entry, ATR and the structure map are fixed for the bar, so the
+                    # plan only depends on side; plan each side at most once
+                    if side_str in plans_by_side:
+                        plan = plans_by_side[side_str]
+                    else:
+                        plan = self.exit_planner.plan(side=side_str, entry=entry_price, atr=atr_val, structures=structures_map)
+                        plans_by_side[side_str] = plan
                     if plan:
-                        planned_sl = Decimal(str(plan["sl"]))
-                        planned_tp = Decimal(str(plan["tp"]))
+                        planned_sl = _as_decimal(plan["sl"])
+                        planned_tp = _as_decimal(plan["tp"])
                         planned_method = plan.get("method", "atr")
                         expected_rr = plan.get("expected_rr")
                         sl_requested = plan.get("sl_requested")
@@ -1741,25 +2116,26 @@ class TradingPipeline:
                     take_profit = planned_tp
                 else:
                     # Log when legacy exit method is used
-                    logger.info(
-                        "legacy_exit_used",
-                        extra={
-                            "symbol": data.symbol,
-                            "structure_type": structure.structure_type.value,
-                            "reason": "exit_planner_returned_none",
-                            "is_bullish": structure.is_bullish,
-                        },
-                    )
-                    if structure.is_bullish:
-                        stop_loss = structure.low_price - (structure.price_range * Decimal("0.1"))
-                        take_profit = entry_price + (structure.price_range * Decimal("2.0"))
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "legacy_exit_used",
+                            extra={
+                                "symbol": data.symbol,
+                                "structure_type": st_value,
+                                "reason": "exit_planner_returned_none",
+                                "is_bullish": is_buy,
+                            },
+                        )
+                    if is_buy:
+                        stop_loss = structure.low_price - (price_range * _LEGACY_SL_RANGE_FRAC)
+                        take_profit = entry_price + (price_range * _LEGACY_TP_RANGE_MULT)
                     else:
-                        stop_loss = structure.high_price + (structure.price_range * Decimal("0.1"))
-                        take_profit = entry_price - (structure.price_range * Decimal("2.0"))
+                        stop_loss = structure.high_price + (price_range * _LEGACY_SL_RANGE_FRAC)
+                        take_profit = entry_price - (price_range * _LEGACY_TP_RANGE_MULT)
 
                 # Safety clamp
-                epsilon = max(Decimal("0.00001"), structure.price_range * Decimal("0.01"))
-                if decision_type == DecisionType.BUY:
+                epsilon = max(_CLAMP_MIN_EPSILON, price_range * _CLAMP_RANGE_FRAC)
+                if is_buy:
                     if stop_loss >= entry_price:
                         stop_loss = entry_price - epsilon
                     if take_profit <= entry_price:
@@ -1778,6 +2154,7 @@ class TradingPipeline:
                     continue
 
                 rr = reward / risk
+                rr_float = float(rr)
 
                 decision = Decision(
                     decision_type=decision_type,
@@ -1787,18 +2164,18 @@ class TradingPipeline:
                     entry_price=entry_price,
                     stop_loss=stop_loss,
                     take_profit=take_profit,
-                    position_size=Decimal("0.1"),
+                    position_size=_UNSIZED_POSITION_SIZE,
                     risk_reward_ratio=rr,
                     structure_id=structure.structure_id,
                     confidence_score=structure.quality_score,
-                    reasoning=f"{structure.structure_type.value}",
+                    reasoning=st_value,
                     status=DecisionStatus.VALIDATED,
                     metadata={
-                        "structure_type": structure.structure_type.value,
-                        "rr": float(rr),
+                        "structure_type": st_value,
+                        "rr": rr_float,
                         "exit_method": planned_method,
-                        "expected_rr": float(expected_rr) if expected_rr else float(rr),
-                        "post_clamp_rr": float(rr),
+                        "expected_rr": float(expected_rr) if expected_rr else rr_float,
+                        "post_clamp_rr": rr_float,
                         "env_mode": self._env_mode,
                         "env_account_size": self._env_account_size,
                         "sl_requested": float(sl_requested) if sl_requested else None,
@@ -1810,51 +2187,32 @@ class TradingPipeline:
                 )
 
                 decisions.append(decision)
-                self._all_decisions.append(decision)
+                self._record_exit_stats(planned_method, st_value, rr_float >= 1.5)
 
             except Exception as e:
                 logger.exception("decision_generation_error", extra={"error": str(e)})
 
         return decisions
 
+    def _record_exit_stats(self, method: str, structure_type: str, rr_passed: bool) -> None:
+        """Tally a generated decision's exit method and RR >= 1.5 gate result."""
+        self._exit_hist[method] = self._exit_hist.get(method, 0) + 1
+        for key in (method, "overall"):
+            counts = self._rr_counts.setdefault(key, [0, 0])
+            if rr_passed:
+                counts[0] += 1
+            counts[1] += 1
+        if method == "legacy":
+            by_structure = self._legacy_by_structure.setdefault(structure_type, {"total": 0, "passed": 0, "failed": 0})
+            by_structure["total"] += 1
+            by_structure["passed" if rr_passed else "failed"] += 1
+
     def finalize_session(self, session_name: str) -> None:
-        hist = {"order_block": 0, "fair_value_gap": 0, "rejection": 0, "atr": 0, "legacy": 0}
-        rr_counts = {k: [0, 0] for k in list(hist.keys()) + ["overall"]}
-        
-        # Legacy-specific tracking
-        legacy_total = 0
-        legacy_passed = 0
-        legacy_failed = 0
-        legacy_by_structure = {}
-
-        for d in self._all_decisions:
-            method = str(d.metadata.get("exit_method", "legacy"))
-            hist[method] = hist.get(method, 0) + 1
-            rr = Decimal(str(d.metadata.get("post_clamp_rr", d.risk_reward_ratio)))
-
-            if rr >= Decimal("1.5"):
-                rr_counts[method][0] += 1
-                rr_counts["overall"][0] += 1
-                if method == "legacy":
-                    legacy_passed += 1
-            else:
-                if method == "legacy":
-                    legacy_failed += 1
-            
-            rr_counts[method][1] += 1
-            rr_counts["overall"][1] += 1
-            
-            # Track legacy by structure type
-            if method == "legacy":
-                legacy_total += 1
-                struct_type = d.metadata.get("structure_type", "unknown")
-                if struct_type not in legacy_by_structure:
-                    legacy_by_structure[struct_type] = {"total": 0, "passed": 0, "failed": 0}
-                legacy_by_structure[struct_type]["total"] += 1
-                if rr >= Decimal("1.5"):
-                    legacy_by_structure[struct_type]["passed"] += 1
-                else:
-                    legacy_by_structure[struct_type]["failed"] += 1
+        hist = dict(self._exit_hist)
+        rr_counts = self._rr_counts
+        legacy_passed, legacy_total = rr_counts["legacy"]
+        legacy_failed = legacy_total - legacy_passed
+        legacy_by_structure = {k: dict(v) for k, v in self._legacy_by_structure.items()}
 
         def pct(v):
             return float((Decimal(v[0]) / Decimal(v[1]) * 100) if v[1] else 0)
@@ -13,11 +13,12 @@ Future phases will add:
 """
 
 import logging
-import json
 import os
 from datetime import datetime, timezone, time
 from typing import Dict, Any, Optional, Tuple
 
+from ..utils.json_cache import load_json_cached
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,8 +88,7 @@ class SessionFilter:
     def _load_config(self, config_path: str) -> None:
         """Load configuration from JSON file."""
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = load_json_cached(config_path)
             
             self.enabled = config.get("enabled", True)
             self.mode = config.get("mode", "log_only")
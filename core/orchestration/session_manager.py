@@ -1,8 +1,9 @@
-import json
 from dataclasses import dataclass
 from datetime import datetime, time, timezone
 from typing import Dict, List, Optional, Tuple
 
+from ..utils.json_cache import load_json_cached
+
 
 @dataclass
 class SessionWindow:
@@ -29,8 +30,8 @@ class SessionManager:
         self._load_configs()
 
     def _load_configs(self) -> None:
-        with open(self.sessions_path, "r", encoding="utf-8") as f:
-            sess = json.load(f)
+        # Parsed JSON is shared across instances (read-only), re-read only when the file changes
+        sess = load_json_cached(self.sessions_path)
         self.timezone = timezone.utc if sess.get("timezone", "UTC").upper() == "UTC" else timezone.utc
         self.windows = []
         for w in sess.get("windows", []):
@@ -45,8 +46,7 @@ class SessionManager:
                     score_bonus=float(w.get("score_bonus", 0.0)),
                 )
             )
-        with open(self.system_path, "r", encoding="utf-8") as f:
-            syscfg = json.load(f)
+        syscfg = load_json_cached(self.system_path)
         self.autonomy = syscfg.get("autonomy", {})
         self.volatility_pause_cfg = syscfg.get("volatility_pause", {})
         self.circuit_breakers_cfg = syscfg.get("circuit_breakers", self.circuit_breakers_cfg)
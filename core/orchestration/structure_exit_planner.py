@@ -3,12 +3,25 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional, Dict, Any, Tuple
 
 
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a price input to Decimal; Decimal inputs are used as-is (no str round-trip)."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
 class StructureExitPlanner:
     def __init__(self, cfg: Dict[str, Any], broker_meta: Dict[str, Any], guards_config: Dict[str, Any] = None):
         self.cfg = cfg.get("sltp_planning", cfg)
         self.broker = broker_meta or {}
         self.guards_config = guards_config or {}
         
+        # Broker rounding/stop-distance fields, parsed once rather than per plan
+        self._digits = int(self.broker.get("digits", 5))
+        self._point = Decimal(str(self.broker.get("point", "0.00001")))
+        self._min_stop = Decimal(str(self.broker.get("min_stop_distance", "0")))
+        max_stop = self.broker.get("max_stop_distance")
+        self._max_stop = Decimal(str(max_stop)) if max_stop is not None else None
+        self._pip_size = self._point * (Decimal(10) if self._digits in (3, 5) else Decimal(1))
+        
         # Legacy exit fallback configuration
         legacy_cfg = self.guards_config.get('legacy_exit_fallback', {})
         self.enable_legacy_fallback = legacy_cfg.get('enabled', True)
@@ -67,8 +80,8 @@ class StructureExitPlanner:
         tp = None
 
         if method == "order_block":
-            lower_edge = Decimal(str(nearest.get("lower_edge")))
-            upper_edge = Decimal(str(nearest.get("upper_edge")))
+            lower_edge = _to_decimal(nearest.get("lower_edge"))
+            upper_edge = _to_decimal(nearest.get("upper_edge"))
             if side.upper() == "BUY":
                 sl = lower_edge - sl_buf
                 tp = self._select_opposing_target("order_block", side, structures)
@@ -88,8 +101,8 @@ class StructureExitPlanner:
                     tp = entry - tp_ext
 
         elif method == "fair_value_gap":
-            gap_low = Decimal(str(nearest.get("gap_low")))
-            gap_high = Decimal(str(nearest.get("gap_high")))
+            gap_low = _to_decimal(nearest.get("gap_low"))
+            gap_high = _to_decimal(nearest.get("gap_high"))
             if side.upper() == "BUY":
                 sl = gap_low - sl_buf
                 tp = gap_high
@@ -181,8 +194,8 @@ class StructureExitPlanner:
         
         # Get rejection zone boundaries
         try:
-            zone_low = Decimal(str(nearest.get("zone_low")))
-            zone_high = Decimal(str(nearest.get("zone_high")))
+            zone_low = _to_decimal(nearest.get("zone_low"))
+            zone_high = _to_decimal(nearest.get("zone_high"))
         except Exception as e:
             if self.enable_legacy_fallback:
                 logger.warning("exit_planner_rejection_invalid", extra={
@@ -347,22 +360,20 @@ class StructureExitPlanner:
             return None
         if method == "order_block":
             if opp_side == "BUY":
-                return Decimal(str(nearest.get("upper_edge")))
+                return _to_decimal(nearest.get("upper_edge"))
             else:
-                return Decimal(str(nearest.get("lower_edge")))
+                return _to_decimal(nearest.get("lower_edge"))
         if method == "fair_value_gap":
             if opp_side == "BUY":
-                return Decimal(str(nearest.get("gap_high")))
+                return _to_decimal(nearest.get("gap_high"))
             else:
-                return Decimal(str(nearest.get("gap_low")))
+                return _to_decimal(nearest.get("gap_low"))
         return None
 
     def _apply_broker_clamps(self, entry: Decimal, sl: Decimal, tp: Decimal, side: str) -> Tuple[Optional[Decimal], Optional[Decimal], bool]:
-        digits = int(self.broker.get("digits", 5))
-        point = Decimal(str(self.broker.get("point", "0.00001")))
-        min_stop = Decimal(str(self.broker.get("min_stop_distance", "0")))
-        max_stop = self.broker.get("max_stop_distance")
-        max_stop = Decimal(str(max_stop)) if max_stop is not None else None
+        point = self._point
+        min_stop = self._min_stop
+        max_stop = self._max_stop
 
         sl_r = self._round_to_point(sl, point)
         tp_r = self._round_to_point(tp, point)
@@ -414,10 +425,7 @@ class StructureExitPlanner:
         return sl, tp, clamped
 
     def _pip_to_price(self, pips: Decimal) -> Decimal:
-        point = Decimal(str(self.broker.get("point", "0.00001")))
-        digits = int(self.broker.get("digits", 5))
-        mul = Decimal(10) if digits in (3, 5) else Decimal(1)
-        return Decimal(str(pips)) * point * mul
+        return Decimal(str(pips)) * self._pip_size
 
     def _round_to_point(self, price: Decimal, point: Decimal) -> Decimal:
         if point == 0:
@@ -41,7 +41,7 @@ class BreakOfStructureDetector(StructureDetector):
         bars = data.bars
         
         # Compute ATR
-        atr = compute_atr_simple(list(bars), self.atr_window)
+        atr = compute_atr_simple(bars, self.atr_window)
         if atr is None or atr == 0:
             return []
         
@@ -71,7 +71,7 @@ class BreakOfStructureDetector(StructureDetector):
             
             if bullish_bos or bearish_bos:
                 direction = 'bullish' if bullish_bos else 'bearish'
-                quality_score = Decimal(str(min(0.95, 0.65)))
+                quality_score = Decimal('0.65')
                 
                 structure = self._create_structure(
                     symbol=data.symbol,
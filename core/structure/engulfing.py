@@ -54,7 +54,7 @@ class EngulfingDetector(StructureDetector):
         bars = data.bars
         
         # Compute ATR
-        atr = compute_atr_simple(list(bars), self.atr_window)
+        atr = compute_atr_simple(bars, self.atr_window)
         if atr is None or atr == 0:
             return []
         
@@ -100,7 +100,7 @@ class EngulfingDetector(StructureDetector):
             if bullish_engulf or bearish_engulf:
                 self.stats.fired += 1
                 direction = 'bullish' if bullish_engulf else 'bearish'
-                quality_score = Decimal(str(min(Decimal('0.95'), Decimal('0.70') + (curr_body / atr) * Decimal('0.1'))))
+                quality_score = min(Decimal('0.95'), Decimal('0.70') + (curr_body / atr) * Decimal('0.1'))
                 
                 structure = self._create_structure(
                     symbol=data.symbol,
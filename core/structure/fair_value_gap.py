@@ -49,7 +49,7 @@ class FairValueGapDetector(StructureDetector):
         bars = data.bars
         
         # Compute ATR
-        atr = compute_atr_simple(list(bars), self.atr_window)
+        atr = compute_atr_simple(bars, self.atr_window)
         if atr is None or atr == 0:
             return []
         
@@ -81,7 +81,7 @@ class FairValueGapDetector(StructureDetector):
             
             if bullish_gap and gap_size_bullish >= min_gap_threshold:
                 self.stats.fired += 1
-                quality_score = Decimal(str(min(Decimal('0.95'), Decimal('0.60') + (gap_size_bullish / atr) * Decimal('0.15'))))
+                quality_score = min(Decimal('0.95'), Decimal('0.60') + (gap_size_bullish / atr) * Decimal('0.15'))
                 
                 structure = self._create_structure(
                     symbol=data.symbol,
@@ -113,7 +113,7 @@ class FairValueGapDetector(StructureDetector):
             
             if bearish_gap and gap_size_bearish >= min_gap_threshold:
                 self.stats.fired += 1
-                quality_score = Decimal(str(min(Decimal('0.95'), Decimal('0.60') + (gap_size_bearish / atr) * Decimal('0.15'))))
+                quality_score = min(Decimal('0.95'), Decimal('0.60') + (gap_size_bearish / atr) * Decimal('0.15'))
                 
                 structure = self._create_structure(
                     symbol=data.symbol,
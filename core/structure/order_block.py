@@ -49,7 +49,7 @@ class OrderBlockDetector(StructureDetector):
         bars = data.bars
         
         # Compute ATR
-        atr = compute_atr_simple(list(bars), self.atr_window)
+        atr = compute_atr_simple(bars, self.atr_window)
         if atr is None or atr == 0:
             return []
         
@@ -85,7 +85,7 @@ class OrderBlockDetector(StructureDetector):
             if is_bullish_ob or is_bearish_ob:
                 self.stats.fired += 1
                 direction = 'bullish' if is_bullish_ob else 'bearish'
-                quality_score = Decimal(str(min(Decimal('0.95'), Decimal('0.60') + (prev_body / atr) * Decimal('0.15'))))
+                quality_score = min(Decimal('0.95'), Decimal('0.60') + (prev_body / atr) * Decimal('0.15'))
                 
                 structure = self._create_structure(
                     symbol=data.symbol,
@@ -54,7 +54,7 @@ class UnifiedZoneRejectionDetector(StructureDetector):
         bars = data.bars
         
         # Compute ATR
-        atr = compute_atr_simple(list(bars), self.atr_window)
+        atr = compute_atr_simple(bars, self.atr_window)
         if atr is None or atr == 0:
             return []
         
@@ -96,7 +96,7 @@ class UnifiedZoneRejectionDetector(StructureDetector):
                 if (is_bullish or is_bearish) and follow_through >= Decimal('0.3'):
                     self.stats.fired += 1
                     direction = 'bullish' if is_bullish else 'bearish'
-                    quality_score = Decimal(str(min(Decimal('0.95'), Decimal('0.60') + (reaction_body / atr) * Decimal('0.15'))))
+                    quality_score = min(Decimal('0.95'), Decimal('0.60') + (reaction_body / atr) * Decimal('0.15'))
                     
                     structure = self._create_structure(
                         symbol=data.symbol,
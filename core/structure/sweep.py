@@ -52,7 +52,7 @@ class SweepDetector(StructureDetector):
         bars = data.bars
         
         # Compute ATR
-        atr = compute_atr_simple(list(bars), self.atr_window)
+        atr = compute_atr_simple(bars, self.atr_window)
         if atr is None or atr == 0:
             return []
         
@@ -84,7 +84,7 @@ class SweepDetector(StructureDetector):
             if bullish_sweep or bearish_sweep:
                 self.stats.fired += 1
                 direction = 'bullish' if bullish_sweep else 'bearish'
-                quality_score = Decimal(str(min(Decimal('0.95'), Decimal('0.60'))))
+                quality_score = Decimal('0.60')
                 
                 structure = self._create_structure(
                     symbol=data.symbol,
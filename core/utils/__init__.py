@@ -1,5 +1,6 @@
 """Utility modules."""
 
 from .numeric import D
+from .json_cache import load_json_cached
 
-__all__ = ['D']
+__all__ = ['D', 'load_json_cached']
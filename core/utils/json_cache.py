@@ -0,0 +1,31 @@
+"""Shared, mtime-validated cache for read-only JSON config files."""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any
+
+try:  # orjson is optional; stdlib json is the fallback
+    from orjson import loads as _loads  # type: ignore
+except ImportError:  # pragma: no cover - environment dependent
+    _loads = json.loads
+
+
+@lru_cache(maxsize=32)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def load_json_cached(path: str) -> Any:
+    """
+    Load a JSON file, reusing the parsed result until its mtime/size change.
+
+    Results are shared between callers, so they must be treated as read-only.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    return _parse_json_file(path, st.st_mtime_ns, st.st_size)
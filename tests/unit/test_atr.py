@@ -0,0 +1,67 @@
+"""
+Unit tests for ATR indicators.
+"""
+
+import random
+import unittest
+from decimal import Decimal
+from datetime import datetime, timezone, timedelta
+
+from core.models.ohlcv import Bar
+from core.indicators.atr import compute_atr_simple, IncrementalATR
+
+
+def make_bars(count, seed=1):
+    rnd = random.Random(seed)
+    bars = []
+    price = Decimal('1.1000')
+    start = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        close = price + Decimal(rnd.randint(-20, 20)) * Decimal('0.00001')
+        high = max(price, close) + Decimal(rnd.randint(0, 10)) * Decimal('0.00001')
+        low = min(price, close) - Decimal(rnd.randint(0, 10)) * Decimal('0.00001')
+        bars.append(Bar(price, high, low, close, Decimal('1000'), start + timedelta(minutes=15 * i)))
+        price = close
+    return bars
+
+
+class TestIncrementalATR(unittest.TestCase):
+    """Test IncrementalATR against the full recompute."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.bars = make_bars(80)
+
+    def test_matches_simple_atr_on_growing_window(self):
+        """Test growing (and repeated) windows match compute_atr_simple exactly."""
+        atr = IncrementalATR(14)
+        for k in range(1, len(self.bars) + 1):
+            window = tuple(self.bars[:k])
+            self.assertEqual(atr.update(window), compute_atr_simple(window, 14))
+            self.assertEqual(atr.update(window), compute_atr_simple(window, 14))
+
+    def test_matches_simple_atr_on_rolling_window(self):
+        """Test a fixed-length rolling window matches compute_atr_simple exactly."""
+        atr = IncrementalATR(14)
+        for k in range(20, len(self.bars) + 1):
+            window = tuple(self.bars[k - 20:k])
+            self.assertEqual(atr.update(window), compute_atr_simple(window, 14))
+
+    def test_reseeds_on_rewind(self):
+        """Test a window that does not continue the history reseeds."""
+        atr = IncrementalATR(14)
+        atr.update(tuple(self.bars))
+        window = tuple(self.bars[:30])
+
+        self.assertEqual(atr.update(window), compute_atr_simple(window, 14))
+
+    def test_insufficient_bars(self):
+        """Test None is returned until period + 1 bars are available."""
+        atr = IncrementalATR(14)
+
+        self.assertIsNone(atr.update(tuple(self.bars[:14])))
+        self.assertIsNotNone(atr.update(tuple(self.bars[:15])))
+
+
+if __name__ == '__main__':
+    unittest.main()
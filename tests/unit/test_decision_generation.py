@@ -0,0 +1,381 @@
+"""Decision generation tests.
+
+Covers:
+- nearest OB/FVG/UZR selection for the exit planner map
+- exit planner invoked at most once per side per bar
+- planner-disabled runs skip the structure map entirely
+- exit-method / RR-gate stats tallied as decisions are generated
+- market open/tradable check cached per symbol until session rotation
+- baseline spread cached per symbol, live spread always re-read
+- session-end close-out only reaches the executor when enabled
+- decision generation skipped for a disabled executor when configured
+- signal conflict window expires old signals incrementally
+- structure thresholds resolved per side, direction-specific keys first
+- a failing session/market stage does not stop the decision stage
+"""
+
+import os
+import sys
+from decimal import Decimal
+from datetime import datetime, time, timezone, timedelta
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core.models.ohlcv import Bar, BarColumns, OHLCV
+from core.models.config import Config
+from core.models.structure import Structure, StructureType, StructureQuality, LifecycleState
+from core.orchestration.pipeline import TradingPipeline
+from core.orchestration.session_manager import SessionWindow
+from core.execution.mt5_executor import MT5Executor, ExecutionMode
+from configs import config_loader
+
+
+def _make_config() -> Config:
+    """Construct Config from on-disk JSON configs via ConfigLoader."""
+    all_configs = config_loader.get_all_configs()
+
+    return Config(
+        session_configs=all_configs["sessions"].get("session_configs", {}),
+        session_rotation=all_configs["sessions"].get("session_rotation", {}),
+        structure_configs=all_configs["structure"].get("structure_configs", {}),
+        quality_thresholds=all_configs["structure"].get("quality_thresholds", {}),
+        scoring_weights=all_configs["scoring"].get("scoring_weights", {}),
+        max_structures=all_configs["structure"].get("max_structures", {}),
+        guard_configs=all_configs["guards"].get("guard_configs", {}),
+        risk_limits=all_configs["guards"].get("risk_limits", {}),
+        sltp_configs=all_configs["sltp"].get("sltp_configs", {}),
+        indicator_configs=all_configs["indicators"],
+        system_configs=all_configs["system"].get("system_configs", {}),
+    )
+
+
+def _create_sample_data(symbol: str = "EURUSD") -> OHLCV:
+    start = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    bars = []
+    for i in range(30):
+        o = Decimal("1.1000") + Decimal(i % 5) * Decimal("0.0001")
+        bars.append(Bar(o, o + Decimal("0.0005"), o - Decimal("0.0004"), o + Decimal("0.0001"),
+                        Decimal("1000"), start + timedelta(minutes=15 * i)))
+    return OHLCV(symbol=symbol, bars=tuple(bars), timeframe="15m")
+
+
+def _structure(sid: str, stype: StructureType, low: str, high: str, direction: str = "bullish") -> Structure:
+    bar = Bar(Decimal(low), Decimal(high), Decimal(low), Decimal(high), Decimal("1000"),
+              datetime(2025, 10, 1, tzinfo=timezone.utc))
+    return Structure(
+        structure_id=sid,
+        structure_type=stype,
+        symbol="EURUSD",
+        timeframe="15m",
+        origin_index=0,
+        start_bar=bar,
+        end_bar=bar,
+        high_price=Decimal(high),
+        low_price=Decimal(low),
+        direction=direction,
+        quality=StructureQuality.HIGH,
+        quality_score=Decimal("0.8"),
+        lifecycle=LifecycleState.UNFILLED,
+        created_timestamp=datetime(2025, 10, 1, tzinfo=timezone.utc),
+        session_id="test_session",
+    )
+
+
+class _CountingPlanner:
+    """Wraps an exit planner and counts plan() calls per side."""
+
+    def __init__(self, planner):
+        self._planner = planner
+        self.cfg = planner.cfg
+        self.calls = []
+
+    def plan(self, side, entry, atr, structures):
+        self.calls.append(side)
+        return self._planner.plan(side=side, entry=entry, atr=atr, structures=structures)
+
+
+class TestDecisionGeneration:
+    """Tests for TradingPipeline._process_decision_generation."""
+
+    def test_structures_map_uses_nearest_of_each_type(self) -> None:
+        entry = Decimal("1.1000")
+        structures = [
+            _structure("ob_far", StructureType.ORDER_BLOCK, "1.0900", "1.0910"),
+            _structure("ob_near", StructureType.ORDER_BLOCK, "1.0980", "1.0990"),
+            _structure("fvg", StructureType.FAIR_VALUE_GAP, "1.0970", "1.0975"),
+        ]
+
+        structures_map = TradingPipeline._build_structures_map(structures, entry)
+
+        assert structures_map["order_block"]["nearest"]["lower_edge"] == Decimal("1.0980")
+        assert structures_map["order_block"]["nearest"]["upper_edge"] == Decimal("1.0990")
+        assert structures_map["fair_value_gap"]["nearest"]["gap_low"] == Decimal("1.0970")
+        assert "rejection" not in structures_map
+
+    def test_structures_map_ties_keep_first_and_include_rejection(self) -> None:
+        entry = Decimal("1.1000")
+        structures = [
+            _structure("ob_below", StructureType.ORDER_BLOCK, "1.0980", "1.0990"),
+            _structure("ob_above", StructureType.ORDER_BLOCK, "1.1010", "1.1020", direction="bearish"),
+            _structure("uzr", StructureType.REJECTION, "1.0995", "1.0999"),
+        ]
+
+        structures_map = TradingPipeline._build_structures_map(structures, entry)
+
+        # both order blocks are 0.0015 from entry; the first one listed wins
+        assert structures_map["order_block"]["nearest"]["side"] == "BUY"
+        assert structures_map["rejection"]["nearest"]["zone_low"] == Decimal("1.0995")
+        assert structures_map["rejection"]["nearest"]["zone_high"] == Decimal("1.0999")
+        assert TradingPipeline._build_structures_map([], entry) == {}
+
+    def test_planner_called_once_per_side(self) -> None:
+        pipeline = TradingPipeline(_make_config())
+        assert pipeline.exit_planner is not None
+        planner = _CountingPlanner(pipeline.exit_planner)
+        pipeline.exit_planner = planner
+
+        structures = [
+            _structure("ob1", StructureType.ORDER_BLOCK, "1.0980", "1.0990"),
+            _structure("ob2", StructureType.ORDER_BLOCK, "1.0970", "1.0985"),
+            _structure("fvg1", StructureType.FAIR_VALUE_GAP, "1.0975", "1.0978"),
+            _structure("ob3", StructureType.ORDER_BLOCK, "1.1010", "1.1020", direction="bearish"),
+            _structure("fvg2", StructureType.FAIR_VALUE_GAP, "1.1015", "1.1018", direction="bearish"),
+        ]
+
+        pipeline._process_decision_generation(structures, _create_sample_data(), datetime.now(timezone.utc))
+
+        assert sorted(planner.calls) == ["BUY", "SELL"]
+
+    def test_planner_disabled_skips_structures_map(self) -> None:
+        pipeline = TradingPipeline(_make_config())
+        pipeline.exit_planner = None
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("structures map should not be built without a planner")
+
+        pipeline._build_structures_map = _fail
+        structures = [_structure("ob1", StructureType.ORDER_BLOCK, "1.0980", "1.0990")]
+
+        decisions = pipeline._process_decision_generation(structures, _create_sample_data(), datetime.now(timezone.utc))
+
+        assert len(decisions) == 1
+        assert decisions[0].metadata["exit_method"] == "legacy"
+
+    def test_exit_stats_tallied_without_retaining_decisions(self) -> None:
+        pipeline = TradingPipeline(_make_config())
+        structures = [
+            _structure("ob1", StructureType.ORDER_BLOCK, "1.0980", "1.0990"),
+            _structure("ob2", StructureType.ORDER_BLOCK, "1.1010", "1.1020", direction="bearish"),
+        ]
+
+        decisions = pipeline._process_decision_generation(structures, _create_sample_data(), datetime.now(timezone.utc))
+
+        assert decisions
+        assert pipeline._rr_counts["overall"][1] == len(decisions)
+        assert sum(pipeline._exit_hist.values()) == len(decisions)
+        passed = sum(1 for d in decisions if d.metadata["post_clamp_rr"] >= 1.5)
+        assert pipeline._rr_counts["overall"][0] == passed
+
+
+class _CountingExecutor:
+    """Stands in for the executor's market guards and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.baseline_calls = 0
+
+    def get_baseline_spread(self, symbol):
+        self.baseline_calls += 1
+        return 0.0001
+
+    def is_market_open(self):
+        self.calls += 1
+        return True
+
+    def is_symbol_tradable(self, symbol):
+        return True
+
+
+class TestMarketTradableCache:
+    """Tests for TradingPipeline._market_tradable."""
+
+    def test_cached_until_cleared(self) -> None:
+        pipeline = TradingPipeline(_make_config())
+        executor = _CountingExecutor()
+        pipeline.executor = executor
+
+        assert pipeline._market_tradable("EURUSD")
+        assert pipeline._market_tradable("EURUSD")
+        assert executor.calls == 1
+
+        pipeline._market_tradable("GBPUSD")
+        assert executor.calls == 2
+
+        pipeline._market_open_cache.clear()
+        pipeline._market_tradable("EURUSD")
+        assert executor.calls == 3
+
+    def test_baseline_spread_cached_per_symbol(self) -> None:
+        pipeline = TradingPipeline(_make_config())
+        executor = _CountingExecutor()
+        pipeline.executor = executor
+
+        assert pipeline._baseline_spread("EURUSD") == 0.0001
+        pipeline._baseline_spread("EURUSD")
+        assert executor.baseline_calls == 1
+
+        pipeline._baseline_spread("GBPUSD")
+        assert executor.baseline_calls == 2
+
+
+class _CloseCountingExecutor(MT5Executor):
+    """Dry-run executor that records close_positions calls."""
+
+    def __init__(self):
+        super().__init__(ExecutionMode.DRY_RUN)
+        self.close_calls = []
+
+    def close_positions(self, symbols=None):
+        self.close_calls.append(symbols)
+        super().close_positions(symbols)
+
+
+class TestSessionEndClose:
+    """Tests for the session-rotation close-out in process_bar."""
+
+    def _run_rotation(self, close_on_end: bool) -> _CloseCountingExecutor:
+        executor = _CloseCountingExecutor()
+        pipeline = TradingPipeline(_make_config(), executor=executor)
+        pipeline._min_bars = 5
+        pipeline._close_positions_on_session_end = close_on_end
+        pipeline.session_mgr.windows = [
+            SessionWindow("ASIA", time(0, 0, tzinfo=timezone.utc), time(6, 59, tzinfo=timezone.utc), 1, 0.0),
+            SessionWindow("LONDON", time(7, 0, tzinfo=timezone.utc), time(11, 59, tzinfo=timezone.utc), 1, 0.0),
+        ]
+        data = _create_sample_data()
+        pipeline.process_bar(data, datetime(2025, 10, 1, 6, 45, tzinfo=timezone.utc))
+        pipeline.process_bar(data, datetime(2025, 10, 1, 7, 0, tzinfo=timezone.utc))
+        return executor
+
+    def test_disabled_skips_executor(self) -> None:
+        assert self._run_rotation(False).close_calls == []
+
+    def test_enabled_closes_tracked_symbols(self) -> None:
+        assert len(self._run_rotation(True).close_calls) == 1
+
+
+class TestSkipDecisionsWhenExecutorDisabled:
+    """Tests for the skip_decisions_when_executor_disabled system flag."""
+
+    def test_structures_still_counted(self) -> None:
+        config = _make_config()
+        config.system_configs = {**config.system_configs, "skip_decisions_when_executor_disabled": True}
+        pipeline = TradingPipeline(config, executor=MT5Executor(ExecutionMode.DRY_RUN, config={"enabled": False}))
+        pipeline._min_bars = 5
+        structures = [_structure("ob1", StructureType.ORDER_BLOCK, "1.0980", "1.0990")]
+        pipeline._process_structure_detection = lambda data: structures
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("decision generation should be skipped")
+
+        pipeline._process_decision_generation = _fail
+
+        decisions = pipeline.process_bar(_create_sample_data(), datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc))
+
+        assert decisions == []
+        assert pipeline.session_mgr.session_counters["decisions_attempted"] == 1
+        assert pipeline.session_mgr.session_counters["decisions_accepted"] == 0
+
+
+class TestSignalConflict:
+    """Tests for TradingPipeline.check_signal_conflict."""
+
+    def test_conflict_window_expires_old_signals(self) -> None:
+        pipeline = TradingPipeline(_make_config())
+        pipeline._enable_conflict_resolver = True
+        pipeline._conflict_lookback_bars = 2
+        pipeline._log_conflicts = False
+
+        assert pipeline.check_signal_conflict("EURUSD", "BUY", 10, 0.8)[1] == 0.0
+        _, bump, info = pipeline.check_signal_conflict("EURUSD", "SELL", 11, 0.8)
+        assert bump == pipeline._conflict_threshold_bump
+        assert info.startswith("Conflict detected: 1 BUY, 0 SELL")
+
+        # bar 10 BUY has left the window; only the bar 11 SELL remains
+        assert pipeline.check_signal_conflict("EURUSD", "SELL", 13, 0.8)[1] == 0.0
+        assert pipeline.check_signal_conflict("EURUSD", "BUY", 13, 0.8)[1] == pipeline._conflict_threshold_bump
+        assert pipeline._signal_counts["EURUSD"] == {"BUY": 1, "SELL": 2}
+        assert pipeline.check_signal_conflict("GBPUSD", "SELL", 13, 0.8)[1] == 0.0
+
+
+class TestStructureThresholds:
+    """Tests for the per-side structure threshold table built at init."""
+
+    def test_direction_specific_overrides_general(self) -> None:
+        pipeline = TradingPipeline(_make_config())
+        thresholds = pipeline._structure_thresholds
+        table = pipeline._structure_threshold_by_side
+
+        # execution_guards.json lowers rejection BUY via rejection_buy only
+        assert table[("rejection", "BUY")] == thresholds["rejection_buy"]
+        assert table[("rejection", "SELL")] == thresholds["rejection"]
+        assert table[("order_block", "SELL")] == thresholds["order_block"]
+        assert ("comment", "BUY") not in table
+        assert ("sweep", "BUY") not in table
+
+
+class TestStageIsolation:
+    """Tests that an error in process_bar's session/market stage is contained."""
+
+    def _pipeline(self) -> TradingPipeline:
+        config = _make_config()
+        config.system_configs = {**config.system_configs, "skip_decisions_when_executor_disabled": True}
+        pipeline = TradingPipeline(config, executor=MT5Executor(ExecutionMode.DRY_RUN, config={"enabled": False}))
+        pipeline._min_bars = 5
+        structures = [_structure("ob1", StructureType.ORDER_BLOCK, "1.0980", "1.0990")]
+        pipeline._process_structure_detection = lambda data: structures
+        return pipeline
+
+    def test_market_check_error_before_atr(self) -> None:
+        pipeline = self._pipeline()
+
+        def _raise(symbol):
+            raise RuntimeError("market check failed")
+
+        pipeline._market_tradable = _raise
+
+        pipeline.process_bar(_create_sample_data(), datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc))
+
+        assert pipeline.session_mgr.session_counters["decisions_attempted"] == 1
+
+    def test_session_rotation_error(self) -> None:
+        pipeline = self._pipeline()
+
+        def _raise(timestamp):
+            raise RuntimeError("rotation failed")
+
+        pipeline.session_mgr.update_and_rotate = _raise
+
+        pipeline.process_bar(_create_sample_data(), datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc))
+
+        assert pipeline.session_mgr.session_counters["decisions_attempted"] == 1
+
+    def test_bar_columns_sync_error(self, monkeypatch) -> None:
+        pipeline = self._pipeline()
+
+        def _raise(self, bars):
+            raise ValueError("bad bar window")
+
+        monkeypatch.setattr(BarColumns, "sync", _raise)
+
+        assert pipeline.process_bar(_create_sample_data(), datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc)) == []
+        assert pipeline.session_mgr.session_counters["decisions_attempted"] == 1
+
+    def test_missing_session_manager(self) -> None:
+        pipeline = TradingPipeline(_make_config())
+        pipeline._min_bars = 5
+        pipeline.session_mgr = None
+
+        assert pipeline.process_bar(_create_sample_data(), datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc)) == []
@@ -0,0 +1,232 @@
+"""LIVE-mode MT5 guard tests (MetaTrader5 replaced by a fake module).
+
+Covers:
+- margin guard fetches symbol_info once per symbol per check
+- position limit counts same-direction positions per symbol
+- position-close tracking looks up each position's order and each symbol once
+- position-close tracking is throttled to check_interval_seconds
+- HTF bias reuses its per-symbol result until the TTL lapses
+- HTF alignment bonus/penalty per bias and direction
+- HTF hard block only applies to counter-trend trades without elite override
+"""
+
+import os
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core.models.config import Config
+from core.orchestration import pipeline as pipeline_mod
+from core.orchestration.pipeline import TradingPipeline
+from core.execution.mt5_executor import ExecutionMode
+from configs import config_loader
+
+
+def _make_config() -> Config:
+    """Construct Config from on-disk JSON configs via ConfigLoader."""
+    all_configs = config_loader.get_all_configs()
+
+    return Config(
+        session_configs=all_configs["sessions"].get("session_configs", {}),
+        session_rotation=all_configs["sessions"].get("session_rotation", {}),
+        structure_configs=all_configs["structure"].get("structure_configs", {}),
+        quality_thresholds=all_configs["structure"].get("quality_thresholds", {}),
+        scoring_weights=all_configs["scoring"].get("scoring_weights", {}),
+        max_structures=all_configs["structure"].get("max_structures", {}),
+        guard_configs=all_configs["guards"].get("guard_configs", {}),
+        risk_limits=all_configs["guards"].get("risk_limits", {}),
+        sltp_configs=all_configs["sltp"].get("sltp_configs", {}),
+        indicator_configs=all_configs["indicators"],
+        system_configs=all_configs["system"].get("system_configs", {}),
+    )
+
+
+class _FakeMT5:
+    """Minimal MetaTrader5 stand-in that counts symbol_info/rates calls."""
+
+    ORDER_TYPE_BUY = 0
+    ORDER_TYPE_SELL = 1
+
+    DEAL_ENTRY_OUT = 1
+
+    def __init__(self, positions, deals=()):
+        self._positions = positions
+        self._deals = deals
+        self.symbol_info_calls = []
+        self.order_calls = []
+        self.rates_calls = 0
+
+    def account_info(self):
+        return SimpleNamespace(equity=10000.0, margin_free=9000.0, margin_level=1000.0)
+
+    def positions_get(self, symbol=None):
+        if symbol is None:
+            return tuple(self._positions)
+        return tuple(p for p in self._positions if p.symbol == symbol)
+
+    TIMEFRAME_H1 = 16385
+
+    def copy_rates_from_pos(self, symbol, timeframe, start, count):
+        self.rates_calls += 1
+        closes = [1.1000 + 0.0001 * i for i in range(count)]
+        rates = np.zeros(count, dtype=[("close", "f8"), ("high", "f8"), ("low", "f8")])
+        rates["close"] = closes
+        rates["high"] = [c + 0.0005 for c in closes]
+        rates["low"] = [c - 0.0005 for c in closes]
+        return rates
+
+    def symbol_info(self, symbol):
+        self.symbol_info_calls.append(symbol)
+        return SimpleNamespace(trade_contract_size=100000.0, margin_initial=0.0, point=0.00001)
+
+    def history_deals_get(self, from_date, to_date):
+        return tuple(self._deals)
+
+    def history_orders_get(self, position=None):
+        self.order_calls.append(position)
+        return (SimpleNamespace(price_open=1.1000, time_setup=datetime(2024, 1, 2, tzinfo=timezone.utc)),)
+
+
+def _position(symbol, pos_type=0, sl=1.0950):
+    return SimpleNamespace(symbol=symbol, type=pos_type, sl=sl, price_open=1.1000, volume=0.01)
+
+
+def _close_deal(position_id, symbol, comment="[sl 1.09500]"):
+    return SimpleNamespace(
+        entry=_FakeMT5.DEAL_ENTRY_OUT, position_id=position_id, ticket=position_id * 10,
+        symbol=symbol, volume=0.01, price=1.0950, profit=-5.0, comment=comment,
+        time=datetime(2024, 1, 2, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture
+def live_pipeline(monkeypatch):
+    def _build(positions, deals=()):
+        fake = _FakeMT5(positions, deals)
+        monkeypatch.setattr(pipeline_mod, "_mt5", fake)
+        pipeline = TradingPipeline(_make_config())
+        pipeline.executor.mode = ExecutionMode.LIVE
+        return pipeline, fake
+    return _build
+
+
+class TestMarginGuard:
+    """Tests for TradingPipeline.check_margin_and_risk_before_trade."""
+
+    def test_symbol_info_fetched_once_per_symbol(self, live_pipeline) -> None:
+        positions = [_position("EURUSD"), _position("EURUSD"), _position("GBPUSD"), _position("GBPUSD", sl=0)]
+        pipeline, fake = live_pipeline(positions)
+        pipeline.enable_margin_guard = True
+
+        can_trade, reason = pipeline.check_margin_and_risk_before_trade("EURUSD", 0.01, 0.0050)
+
+        assert can_trade and reason is None
+        assert sorted(fake.symbol_info_calls) == ["EURUSD", "GBPUSD"]
+
+
+class TestPositionLimit:
+    """Tests for TradingPipeline.check_position_limit."""
+
+    def test_same_direction_limit(self, live_pipeline) -> None:
+        positions = [_position("EURUSD", _FakeMT5.ORDER_TYPE_SELL), _position("GBPUSD", _FakeMT5.ORDER_TYPE_SELL)]
+        pipeline, _ = live_pipeline(positions)
+        pipeline._enable_position_limit = True
+        pipeline._max_positions_per_symbol = 5
+        pipeline._max_positions_per_direction = 1
+        pipeline._log_position_limit_blocks = False
+
+        assert pipeline.check_position_limit("EURUSD", "BUY") == (True, None)
+        can_trade, reason = pipeline.check_position_limit("EURUSD", "SELL")
+        assert not can_trade
+        assert reason == "Max 1 SELL positions reached (1 open)"
+
+
+class TestPositionCloseTracking:
+    """Tests for TradingPipeline.track_position_closes."""
+
+    def test_lookups_shared_within_batch(self, live_pipeline) -> None:
+        deals = [_close_deal(1, "EURUSD"), _close_deal(1, "EURUSD"), _close_deal(2, "EURUSD"), _close_deal(3, "GBPUSD")]
+        pipeline, fake = live_pipeline([], deals)
+        pipeline._position_tracking_enabled = True
+        outcomes = []
+        pipeline.trade_journal = SimpleNamespace(record_outcome=lambda **kw: outcomes.append(kw))
+
+        pipeline.track_position_closes()
+
+        assert fake.order_calls == [1, 2, 3]
+        assert fake.symbol_info_calls == ["EURUSD", "GBPUSD"]
+        assert [o["ticket"] for o in outcomes] == [1, 1, 2, 3]
+        assert {o["exit_reason"] for o in outcomes} == {"sl_hit"}
+        assert outcomes[0]["point"] == 0.00001
+
+    def test_throttled_to_check_interval(self, live_pipeline) -> None:
+        pipeline, fake = live_pipeline([], [_close_deal(1, "EURUSD")])
+        pipeline._position_tracking_enabled = True
+        pipeline.trade_journal = None
+
+        pipeline.track_position_closes()
+        pipeline.track_position_closes()
+        assert fake.order_calls == [1]
+
+        pipeline._next_position_check = 0.0
+        pipeline.track_position_closes()
+        assert fake.order_calls == [1, 1]
+
+
+class TestHTFBias:
+    """Tests for TradingPipeline HTF bias caching and application."""
+
+    def test_result_cached_until_ttl(self, live_pipeline) -> None:
+        pipeline, fake = live_pipeline([])
+        pipeline._enable_htf_bias = True
+
+        bias, _, details = pipeline.get_htf_bias("EURUSD")
+        assert bias == "bullish"
+        assert pipeline.get_htf_bias("EURUSD")[2] is details
+        assert fake.rates_calls == 1
+
+        pipeline._htf_cache["EURUSD"] = (0.0,) + pipeline._htf_cache["EURUSD"][1:]
+        pipeline.get_htf_bias("EURUSD")
+        assert fake.rates_calls == 2
+
+    def test_alignment_modifiers(self, live_pipeline) -> None:
+        pipeline, _ = live_pipeline([])
+        pipeline._enable_htf_bias = True
+        pipeline._htf_hard_block = False
+        pipeline._htf_log_checks = False
+        bonus, penalty = pipeline._htf_bias_bonus, pipeline._htf_bias_penalty
+
+        for bias, direction, alignment, modifier in [
+            ("bullish", "BUY", "aligned", bonus),
+            ("bearish", "SELL", "aligned", bonus),
+            ("bullish", "SELL", "counter", -penalty),
+            ("bearish", "BUY", "counter", -penalty),
+            ("neutral", "BUY", "neutral", 0.0),
+        ]:
+            pipeline.get_htf_bias = lambda symbol, bias=bias: (bias, 0.0, {})
+            score, _, details = pipeline.apply_htf_bias("EURUSD", direction, 0.7)
+            assert details["alignment"] == alignment
+            assert score == pytest.approx(0.7 + modifier)
+
+    def test_hard_block_counter_only(self, live_pipeline) -> None:
+        pipeline, _ = live_pipeline([])
+        pipeline._enable_htf_bias = True
+        pipeline._htf_hard_block = True
+        pipeline._htf_log_checks = False
+        pipeline.get_htf_bias = lambda symbol: ("bullish", 0.0, {})
+        high = pipeline._htf_override_score
+
+        assert pipeline.apply_htf_bias("EURUSD", "BUY", high)[1] is False
+        assert pipeline.apply_htf_bias("EURUSD", "SELL", high - 0.01)[1] is True
+        # Elite override lets a high-confidence counter-trend trade through,
+        # except for structure types that are not eligible for it
+        _, blocked, details = pipeline.apply_htf_bias("EURUSD", "SELL", high, "order_block")
+        assert blocked is False and details["elite_override"] is True
+        assert pipeline.apply_htf_bias("EURUSD", "SELL", high, "rejection")[1] is True
@@ -6,7 +6,7 @@ import unittest
 from decimal import Decimal
 from datetime import datetime, timezone, timedelta
 
-from core.models.ohlcv import Bar, OHLCV
+from core.models.ohlcv import Bar, OHLCV, BarColumns
 from core.models.decision import Decision, DecisionType, DecisionStatus
 from core.models.structure import Structure, StructureType, StructureQuality
 from core.models.session import Session, SessionType, SessionState
@@ -79,6 +79,104 @@ class TestOHLCV(unittest.TestCase):
         self.assertEqual(ohlcv.latest_bar, self.bars[-1])
 
 
+class TestBarColumns(unittest.TestCase):
+    """Test BarColumns columnar bar history."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.bars = []
+        timestamp = datetime(2025, 10, 1, tzinfo=timezone.utc)
+        
+        for i in range(10):
+            bar = Bar(
+                open=Decimal('1.1000') + Decimal(i) * Decimal('0.0001'),
+                high=Decimal('1.1010') + Decimal(i) * Decimal('0.0001'),
+                low=Decimal('1.0990') + Decimal(i) * Decimal('0.0001'),
+                close=Decimal('1.1005') + Decimal(i) * Decimal('0.0001'),
+                volume=Decimal('1000000'),
+                timestamp=timestamp + timedelta(minutes=15 * i)
+            )
+            self.bars.append(bar)
+    
+    def test_sync_appends_only_new_bars(self):
+        """Test growing, repeated and rolling windows append incrementally."""
+        columns = BarColumns(capacity=100)
+        
+        self.assertEqual(columns.sync(tuple(self.bars[:5])), 5)
+        self.assertEqual(columns.sync(tuple(self.bars[:5])), 0)
+        self.assertEqual(columns.sync(tuple(self.bars[:7])), 2)
+        self.assertEqual(columns.sync(tuple(self.bars[3:8])), 1)
+        self.assertEqual(len(columns), 8)
+        self.assertEqual(list(columns.last_n('close', 2)), [float(b.close) for b in self.bars[6:8]])
+        # No gaps in these bars, so the true range is the bar range
+        self.assertEqual(list(columns.last_n('tr', 1)), [float(self.bars[7].high - self.bars[7].low)])
+    
+    def test_sync_reseeds_on_rewind(self):
+        """Test a window that does not continue the stored history reseeds."""
+        columns = BarColumns(capacity=100)
+        columns.sync(tuple(self.bars[5:]))
+        
+        self.assertEqual(columns.sync(tuple(self.bars[:3])), 3)
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(columns.last_timestamp, self.bars[2].timestamp)
+    
+    def test_capacity_trim(self):
+        """Test stored history is trimmed while keeping the latest bars."""
+        columns = BarColumns(capacity=3)
+        for bar in self.bars:
+            columns.append(bar)
+        
+        # Trimmed back to capacity once 2x capacity is reached (at bars 6 and 9),
+        # so 10 appends leave the last 4 bars
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(columns.last_timestamp, self.bars[-1].timestamp)
+        self.assertEqual(list(columns.last_n('close', 4)), [float(b.close) for b in self.bars[-4:]])
+        self.assertEqual(list(columns.last_n('high', 3)), [float(b.high) for b in self.bars[-3:]])
+    
+    def test_tr_mean(self):
+        """Test the running true-range mean matches a fresh average."""
+        columns = BarColumns(capacity=5, tr_window=4)
+        for k in range(1, len(self.bars) + 1):
+            columns.sync(tuple(self.bars[:k]))
+        
+        # No gaps in these bars, so each true range is the bar range
+        expected = [float(b.high - b.low) for b in self.bars[-4:]]
+        self.assertAlmostEqual(columns.tr_mean(4), sum(expected) / 4)
+        self.assertAlmostEqual(columns.tr_mean(2), sum(expected[-2:]) / 2)
+    
+    def test_tr_mean_during_warm_up(self):
+        """Test the running sum answers while fewer than tr_window bars are stored."""
+        columns = BarColumns(capacity=100, tr_window=50)
+        columns.sync(tuple(self.bars[:6]))
+        
+        expected = [float(b.high - b.low) for b in self.bars[:6]]
+        self.assertEqual(columns.tr_mean(6), sum(expected) / 6)
+        self.assertAlmostEqual(columns.tr_mean(3), sum(expected[-3:]) / 3)
+    
+    def test_tr_mean_includes_gaps(self):
+        """Test the running true-range mean covers gaps to the previous close."""
+        gap = Bar(
+            open=Decimal('1.1030'),
+            high=Decimal('1.1040'),
+            low=Decimal('1.1025'),
+            close=Decimal('1.1035'),
+            volume=Decimal('1000000'),
+            timestamp=self.bars[-1].timestamp + timedelta(minutes=15)
+        )
+        bars = self.bars + [gap]
+        columns = BarColumns(capacity=5, tr_window=4)
+        for k in range(1, len(bars) + 1):
+            columns.sync(tuple(bars[:k]))
+        
+        expected = [
+            float(max(b.high - b.low, abs(b.high - p.close), abs(b.low - p.close)))
+            for p, b in zip(bars[-5:-1], bars[-4:])
+        ]
+        self.assertEqual(list(columns.last_n('tr', 1)), [float(gap.high - self.bars[-1].close)])
+        self.assertAlmostEqual(columns.tr_mean(4), sum(expected) / 4)
+        self.assertAlmostEqual(columns.tr_mean(2), sum(expected[-2:]) / 2)
+
+
 class TestDecision(unittest.TestCase):
     """Test Decision model."""
     
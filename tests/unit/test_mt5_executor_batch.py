@@ -0,0 +1,62 @@
+"""MT5Executor batch submission tests.
+
+Covers:
+- results come back in submission order
+- empty batch is a no-op
+- disabled executor rejects every order without sending
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core.execution.mt5_executor import MT5Executor, ExecutionMode
+
+
+def _order(symbol: str, order_type: str = "BUY") -> dict:
+    if order_type == "BUY":
+        sl, tp = 1.0950, 1.1100
+    else:
+        sl, tp = 1.1050, 1.0900
+    return {
+        "symbol": symbol,
+        "order_type": order_type,
+        "volume": 0.1,
+        "entry_price": 1.1000,
+        "stop_loss": sl,
+        "take_profit": tp,
+        "comment": "DEVI_order_block",
+    }
+
+
+class TestExecuteOrdersBatch:
+    """Tests for MT5Executor.execute_orders_batch."""
+
+    def test_results_follow_submission_order(self) -> None:
+        executor = MT5Executor(ExecutionMode.DRY_RUN)
+        orders = [_order("EURUSD", "BUY"), _order("GBPUSD", "SELL")]
+
+        results = executor.execute_orders_batch(orders)
+
+        assert len(results) == 2
+        assert [r.payload["symbol"] for r in results] == ["EURUSD", "GBPUSD"]
+        assert all(r.success for r in results)
+        assert len(executor.dry_run_orders) == 2
+
+    def test_empty_batch(self) -> None:
+        executor = MT5Executor(ExecutionMode.DRY_RUN)
+
+        assert executor.execute_orders_batch([]) == []
+        assert executor.dry_run_orders == []
+
+    def test_disabled_executor_rejects_all(self) -> None:
+        executor = MT5Executor(ExecutionMode.DRY_RUN, config={"enabled": False})
+
+        results = executor.execute_orders_batch([_order("EURUSD"), _order("EURUSD", "SELL")])
+
+        assert len(results) == 2
+        assert not any(r.success for r in results)
+        assert executor.dry_run_orders == []
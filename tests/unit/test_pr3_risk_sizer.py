@@ -4,6 +4,7 @@ Covers:
 - risk_too_small guard
 - risk_cap_hit guard
 - execution_sized happy-path contract
+- lot-step flooring of the sized volume
 """
 
 import json
@@ -21,7 +22,7 @@ if PROJECT_ROOT not in sys.path:
 
 from core.models.ohlcv import Bar, OHLCV
 from core.models.config import Config
-from core.orchestration.pipeline import TradingPipeline
+from core.orchestration.pipeline import TradingPipeline, _SymbolMeta, _size_volume
 from configs import config_loader
 
 
@@ -74,6 +75,40 @@ def _make_config() -> Config:
 class TestPR3RiskSizer:
     """Tests for PR3 risk-based sizing and open-risk cap behavior."""
 
+    def test_size_volume_floors_to_lot_step_and_caps(self) -> None:
+        """Volume is floored to the lot step, rejected below min lot and capped at max lot."""
+        meta = _SymbolMeta.from_config("EURUSD", {"point": 0.00001, "volume_min": 0.01, "volume_max": 1.0, "volume_step": 0.01})
+
+        # 100 / (100 points * $1 per point per lot) = 1.0 lot raw
+        volume_raw, volume = _size_volume(100.0, 100.0, meta)
+        assert volume_raw == pytest.approx(1.0)
+        assert volume == Decimal("1.00")
+
+        _, volume = _size_volume(37.5, 100.0, meta)
+        assert volume == Decimal("0.37")
+
+        _, volume = _size_volume(0.5, 100.0, meta)
+        assert volume is None
+
+        # exactly one lot step is accepted as min lot
+        _, volume = _size_volume(1.0, 100.0, meta)
+        assert volume == Decimal("0.01")
+
+        _, volume = _size_volume(10000.0, 100.0, meta)
+        assert volume == meta.max_lot_dec
+
+    def test_size_volume_keeps_exact_lot_step_multiples(self) -> None:
+        """Budgets landing exactly on a lot step are not floored a step short by float drift."""
+        meta = _SymbolMeta.from_config("EURUSD", {"point": 0.00001, "volume_min": 0.01, "volume_max": 100.0, "volume_step": 0.01})
+
+        for budget, expected in [(29.0, "0.29"), (57.0, "0.57"), (58.0, "0.58"), (113.0, "1.13")]:
+            _, volume = _size_volume(budget, 100.0, meta)
+            assert volume == Decimal(expected)
+
+        # just short of a step still floors down
+        _, volume = _size_volume(28.9999, 100.0, meta)
+        assert volume == Decimal("0.28")
+
     def test_risk_too_small_guard_logs_and_skips(self, caplog: pytest.LogCaptureFixture) -> None:
         """When per-trade risk is tiny, pipeline should log risk_too_small and not execute orders."""
         all_configs = config_loader.get_all_configs()